@@ -16,5 +16,5 @@ from .clients.filemaker_client import FilemakerClient  # noqa
 from .clients.digital_data_client import DigitalDataClient  # noqa
 
 # Metadata generator
-from .metadata.mams_metadata import get_mams_metadata  # noqa
+from .metadata.mams_metadata import get_mams_metadata, get_mams_metadata_batch  # noqa
 from .metadata.mams_metadata_ndm import get_mams_metadata_ndm  # noqa
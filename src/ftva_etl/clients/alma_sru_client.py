@@ -1,20 +1,51 @@
-import requests
-import xml.etree.ElementTree as ET
-from pymarc import parse_xml_to_array, Record, Field
+import threading
+from cachetools import TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
+from urllib.parse import urlencode
+from lxml import etree as ET
+from pymarc import Record, Field, Indicators, Leader
+from .http_session import create_session
+
+# Namespace-qualified MARCXML tags, as they appear on parsed lxml elements.
+# Precomputed so element tags can be compared directly while converting records.
+_MARC_NAMESPACE = "http://www.loc.gov/MARC21/slim"
+_MARC_RECORD_TAG = f"{{{_MARC_NAMESPACE}}}record"
+_MARC_LEADER_TAG = f"{{{_MARC_NAMESPACE}}}leader"
+_MARC_CONTROLFIELD_TAG = f"{{{_MARC_NAMESPACE}}}controlfield"
+_MARC_DATAFIELD_TAG = f"{{{_MARC_NAMESPACE}}}datafield"
+_MARC_SUBFIELD_TAG = f"{{{_MARC_NAMESPACE}}}subfield"
 
 
 class AlmaSRUClient:
     def __init__(
-        self, sru_url: str = "https://ucla.alma.exlibrisgroup.com/view/sru/01UCS_LAL"
+        self,
+        sru_url: str = "https://ucla.alma.exlibrisgroup.com/view/sru/01UCS_LAL",
+        timeout: int = 30,
+        cache_maxsize: int = 10_000,
+        cache_ttl: float = 300,
     ) -> None:
         self._SRU_URL = sru_url
+        self._timeout = timeout
         # For our purposes, for now, hard-code these.
         self._SRU_DEFAULT_PARAMETERS = {
             "version": "1.2",
             "operation": "searchRetrieve",
             "recordSchema": "marcxml",
         }
+        # The default parameters are the same for every search,
+        # so URL-encode them once, rather than on every request.
+        self._SRU_DEFAULT_QUERY_STRING = urlencode(self._SRU_DEFAULT_PARAMETERS)
+        # Share one session across searches, so connections to Alma are reused.
+        self._session = create_session()
+
+        # Search responses are cached for `cache_ttl` seconds, keyed by index
+        # and search term, so repeated searches within a run skip Alma.
+        # The lock makes the cache safe to share across threads.
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
 
     def search_by_call_number(self, call_number: str) -> list[Record]:
         """Fetches Alma data for a given call number.
@@ -25,7 +56,23 @@ class AlmaSRUClient:
         sru_response = self._search_alma(
             index="alma.PermanentCallNumber", search_term=call_number
         )
-        return self._convert_sru_xml_to_marc_records(sru_response)
+        return list(self._convert_sru_xml_to_marc_records(sru_response))
+
+    def search_by_call_numbers(
+        self, call_numbers: Iterable[str], max_workers: int = 10
+    ) -> dict[str, list[Record]]:
+        """Fetches Alma data for multiple call numbers, searching concurrently.
+
+        :param call_numbers: Call numbers to search in Alma.
+        :param max_workers: Maximum number of searches in flight at once.
+        :return: Dict mapping each call number to the list of pymarc records
+        found by its search.
+        """
+        # Drop duplicates, keeping the original order.
+        unique_call_numbers = list(dict.fromkeys(call_numbers))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(self.search_by_call_number, unique_call_numbers)
+            return dict(zip(unique_call_numbers, results))
 
     def get_fields(self, marc_record: Record, tag_list: list[str]) -> list[Field]:
         """Extracts the specified fields from a MARC record.
@@ -36,75 +83,109 @@ class AlmaSRUClient:
         """
         # pymarc.Record.get_fields() needs to have list of tags unpacked:
         # get_fields("tag1", "tag2", ...)
-        # get_fields returns an empty list if no fields found.
+        # It makes a single pass over the record's fields for all tags,
+        # returning matches in record order, or an empty list if no fields found.
         # TODO: Return fields themselves, or friendlier representations?
         # print(f.tag, f.indicator1, f.indicator2, f.format_field())
-        return marc_record.get_fields(self, *tag_list)
-
-    def _search_alma(self, index: str, search_term: str) -> str:
+        return marc_record.get_fields(*tag_list)
+
+    @cachedmethod(
+        lambda self: self._cache,
+        key=lambda self, index, search_term: hashkey(index, search_term),
+        lock=lambda self: self._cache_lock,
+    )
+    def _search_alma(self, index: str, search_term: str) -> bytes:
         """Searches Alma via SRU, using the given index and search term.
 
         :param index: A valid Alma SRU index. TODO: Add 'explain' method to get indexes?
         :param search_term: A word or phrase to search for.
-        :return: The XML from the response, as a UTF-8 encoded string.
+        :return: The XML from the response, as raw bytes.
         """
-        # URL parameters are simple key/value strings, copy() is safe.
-        params = self._SRU_DEFAULT_PARAMETERS.copy()
-
         # If the search term contains spaces, wrap it in double quotes.
         if " " in search_term:
             search_term = f'"{search_term}"'
 
         # Desired result is query=index=search_term;
-        # as a request parameter, query: index=search_term
-        query = {"query": f"{index}={search_term}"}
-        params.update(query)
+        # only this parameter varies, so only it needs encoding here.
+        query = urlencode({"query": f"{index}={search_term}"})
+        url = f"{self._SRU_URL}?{self._SRU_DEFAULT_QUERY_STRING}&{query}"
 
         # Do the search.
-        response = requests.get(url=self._SRU_URL, params=params)
+        response = self._session.get(url=url, timeout=self._timeout)
 
         # Alma SRU response status is still 200 even if invalid request sent;
         # consider checking for "diagnostic" (and more) XML in response.text,
         # but for now just raise exeeption if any non-OK response is received.
         response.raise_for_status()
 
-        # No exception, so return response text.
+        # No exception, so return response content.
+        # The raw bytes are returned, rather than decoded text,
+        # so the XML parser can handle the document's own encoding declaration.
         # TODO: what if no records found or other problems?
-        return response.text
+        return response.content
 
-    def _convert_sru_xml_to_marc_records(self, sru_response: str) -> list[Record]:
-        """Converts the XML returned by a SRU search into a list of pymarc records.
+    def _convert_sru_xml_to_marc_records(self, sru_response: bytes) -> Iterator[Record]:
+        """Converts the XML returned by a SRU search into pymarc records.
+
+        The response is parsed incrementally, so only the MARCXML record
+        currently being converted is held in memory as an element tree.
 
         :param sru_response: XML, as returned in an SRU search response.
-        :return pymarc_records: A list of pymarc records.
+        :return: A generator of pymarc records.
         """
-
-        # Convert the SRU response to an Element.
-        root = ET.fromstring(sru_response)
-
-        # Clear default namespace to avoid "ns0" prefix on records.
-        ET.register_namespace("", "http://www.loc.gov/MARC21/slim")
-
-        # Create short names for the XML namespaces in the response.
-        namespaces = {
-            "sru": "http://www.loc.gov/zing/srw/",
-            "marc": "http://www.loc.gov/MARC21/slim",
-        }
-
-        # Find all MARCXML records embedded in the response.
-        records = root.findall(
-            "./sru:records/sru:record/sru:recordData/marc:record", namespaces
+        # Only MARCXML records embedded in the response are of interest;
+        # their "end" event fires once the whole record has been parsed.
+        marc_records = ET.iterparse(
+            BytesIO(sru_response),
+            events=("end",),
+            tag=_MARC_RECORD_TAG,
         )
-
-        # Convert each MARCXML record to pymarc.Record.
-        pymarc_records = []
-        for record in records:
+        for _, record in marc_records:
             # TODO: Possibly consolidate this with alma_marc.get_pymarc_record_from_bib;
             # core conversion is the same, but setup is different.
-            marc_xml = ET.tostring(record, encoding="utf-8")
-            # pymarc needs a file-like object to convert XML.
-            with BytesIO(marc_xml) as fh:
-                pymarc_record = parse_xml_to_array(fh)[0]
-                pymarc_records.append(pymarc_record)
-
-        return pymarc_records
+            yield self._convert_marc_element_to_record(record)
+
+            # Free the converted record, along with any already-processed
+            # siblings of its ancestors (e.g. earlier SRU record wrappers).
+            # The document root has no parent to delete from; anything before it
+            # (e.g. a comment) is a sibling outside the tree, so stop there.
+            record.clear()
+            for ancestor in record.iterancestors():
+                parent = ancestor.getparent()
+                if parent is None:
+                    break
+                while ancestor.getprevious() is not None:
+                    del parent[0]
+
+    def _convert_marc_element_to_record(self, marc_element: ET._Element) -> Record:
+        """Converts a MARCXML record element into a pymarc record.
+
+        This builds the record directly from the parsed element, following the same
+        rules as pymarc's own MARCXML handler, rather than serializing each record
+        back to XML just to have pymarc parse it again.
+
+        :param marc_element: A MARCXML `record` element.
+        :return pymarc_record: A pymarc record.
+        """
+        pymarc_record = Record()
+        for child in marc_element.iterchildren(
+            _MARC_LEADER_TAG, _MARC_CONTROLFIELD_TAG, _MARC_DATAFIELD_TAG
+        ):
+            if child.tag == _MARC_LEADER_TAG:
+                pymarc_record.leader = Leader(child.text or "")
+            elif child.tag == _MARC_CONTROLFIELD_TAG:
+                pymarc_record.add_field(
+                    Field(tag=child.get("tag"), data=child.text or "")
+                )
+            else:
+                field = Field(
+                    tag=child.get("tag"),
+                    indicators=Indicators(
+                        child.get("ind1", " "), child.get("ind2", " ")
+                    ),
+                )
+                for subfield in child.iterchildren(_MARC_SUBFIELD_TAG):
+                    field.add_subfield(subfield.get("code"), subfield.text or "")
+                pymarc_record.add_field(field)
+
+        return pymarc_record
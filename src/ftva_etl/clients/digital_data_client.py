@@ -1,4 +1,11 @@
-import requests
+import orjson
+import threading
+from cachetools import LRUCache, TTLCache, cachedmethod
+from cachetools.keys import hashkey
+from collections.abc import Iterable, MutableMapping
+from concurrent.futures import ThreadPoolExecutor
+from requests import HTTPError
+from .http_session import create_session
 
 
 class DigitalDataClient:
@@ -7,14 +14,42 @@ class DigitalDataClient:
         user: str,
         password: str,
         url: str = "https://digital-data.cinema.ucla.edu",
+        timeout: int = 30,
+        cache_maxsize: int = 10_000,
+        cache_ttl: float = 300,
+        etag_cache: MutableMapping[str, tuple[str, dict]] | None = None,
     ) -> None:
         self._user = user
         self._password = password
         self._url = url
+        self._timeout = timeout
 
+        # Records fetched by id are cached for `cache_ttl` seconds,
+        # so repeated lookups of the same id within a run skip the API.
+        # The lock makes the cache safe to share across threads.
+        self._cache = TTLCache(maxsize=cache_maxsize, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+
+        # Records are also stored with their ETag, keyed by URL, so later requests
+        # can ask the API to send the record only if it has changed.
+        # Defaults to in-memory, holding at most `cache_maxsize` records;
+        # pass a persistent mapping (e.g. a `shelve.Shelf`) to reuse ETags across runs.
+        # The lock makes the cache safe to share across threads.
+        self._etag_cache: MutableMapping[str, tuple[str, dict]] = (
+            etag_cache if etag_cache is not None else LRUCache(maxsize=cache_maxsize)
+        )
+        self._etag_cache_lock = threading.Lock()
+
+        # Share one session across requests, so connections to the API are reused.
+        self._session = create_session(auth=(self._user, self._password))
+
+    @cachedmethod(lambda self: self._cache, lock=lambda self: self._cache_lock)
     def get_record_by_id(self, record_id: int) -> dict:
         """Get the FTVA Digital Data record matching the input record id.
 
+        Results are cached, so the same dict is returned for repeated calls
+        with the same id until it expires; callers should not modify it.
+
         :param record_id: FTVA Digital Data record id.
         :return: Dict containing all of the record's data.
         :raises HTTPError: If response status code is 400-599.
@@ -22,6 +57,43 @@ class DigitalDataClient:
         url = f"{self._url}/records/{record_id}"
         return self._get_record(url)
 
+    def invalidate(self, record_id: int) -> None:
+        """Remove a record from the cache, so the next lookup fetches it again.
+
+        Use this after a record has been changed in FTVA Digital Data.
+
+        :param record_id: FTVA Digital Data record id.
+        """
+        with self._cache_lock:
+            self._cache.pop(hashkey(record_id), None)
+
+    def get_records_by_ids(
+        self, record_ids: Iterable[int], max_workers: int = 10
+    ) -> list[dict]:
+        """Get the FTVA Digital Data records matching the input record ids.
+
+        Requests are sent concurrently, so a batch of ids takes roughly as long
+        as the slowest few requests, rather than the sum of all of them.
+
+        :param record_ids: FTVA Digital Data record ids.
+        :param max_workers: Maximum number of requests in flight at once.
+        :return: List of dicts containing each record's data,
+        in the same order as `record_ids`. Repeated ids are only fetched once.
+        :raises HTTPError: If any response status code is 400-599.
+        """
+        record_ids = list(record_ids)
+        # Drop duplicates, keeping the original order, so concurrent requests
+        # don't fetch the same record before the first one is cached.
+        unique_record_ids = list(dict.fromkeys(record_ids))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            records_by_id = dict(
+                zip(
+                    unique_record_ids,
+                    executor.map(self.get_record_by_id, unique_record_ids),
+                )
+            )
+        return [records_by_id[record_id] for record_id in record_ids]
+
     def get_records(
         self,
         offset: int | None = None,
@@ -51,10 +123,11 @@ class DigitalDataClient:
         if fields:
             params["fields"] = ",".join(fields)
 
-        response = requests.get(url, auth=(self._user, self._password), params=params)
+        response = self._session.get(url, params=params, timeout=self._timeout)
         response.raise_for_status()
         if response.status_code == 200:
-            return response.json()
+            # orjson decodes the response bytes much faster than the stdlib json module.
+            return orjson.loads(response.content)
         else:
             # NOTE: Fallback response format is hard-coded here,
             # in case the response status is unexpected,
@@ -66,14 +139,35 @@ class DigitalDataClient:
         """General routine for fetching data.
 
         :param url: The fully formed URL for the request.
-        :return: Dict containing all of the record's data.
-        :raises HTTPError: If response status code is 400-599.
+        :return: Dict containing all of the record's data,
+            or an empty dict if the response has no content.
+        :raises HTTPError: If response status code is 400-599,
+            or 304 for a request without an ETag.
         """
         # Very simple for now, matching the minimal REST API provided by
         # the FTVA Django application it calls.
-        response = requests.get(url, auth=(self._user, self._password))
+        # If this record was fetched before, make the request conditional on its ETag.
+        with self._etag_cache_lock:
+            cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        response = self._session.get(url, headers=headers, timeout=self._timeout)
+        # 304 Not Modified: the record is unchanged, and the response has no body,
+        # so return the copy from the previous fetch.
+        if response.status_code == 304:
+            if cached:
+                return cached[1]
+            # Without an ETag in the request, there is nothing to be "not modified",
+            # and no record to return.
+            raise HTTPError(
+                f"Unexpected 304 Not Modified response for {url}", response=response
+            )
         response.raise_for_status()
-        if response.status_code == 200:
-            return response.json()
-        else:
+        # 204 No Content is the only success response without a record to decode.
+        if response.status_code == 204:
             return {}
+        record = orjson.loads(response.content)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._etag_cache_lock:
+                self._etag_cache[url] = (etag, record)
+        return record
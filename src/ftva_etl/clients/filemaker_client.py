@@ -1,4 +1,8 @@
 import fmrest
+import logging
+from collections.abc import Iterable
+from itertools import batched
+from operator import itemgetter
 from fmrest.record import Record
 
 # NOTE: FileMakerError does not provide error codes as integers,
@@ -6,6 +10,43 @@ from fmrest.record import Record
 # See Filemaker error codes reference @https://help.claris.com/en/pro-help/content/error-codes.html
 from fmrest.exceptions import FileMakerError
 
+# Create a module logger, which will be a child of the package logger
+logger = logging.getLogger(__name__)
+
+# Fields returned by `FilemakerClient.get_fields()` when no field list is given.
+_DEFAULT_FIELDS = (
+    "Acquisition type",
+    "Alma",
+    "aka",
+    "availability",
+    "director",
+    "donor_code",
+    "element_info",
+    "episode no.",
+    "episode_title",
+    "film base",
+    "format_type",
+    "inventory_id",
+    "inventory_no",
+    "notes",
+    "production_type",
+    "release_broadcast_year",
+    "spac",
+    "title",
+    "type",
+)
+# Gets all default fields from a record's dict in one call.
+_get_default_field_values = itemgetter(*_DEFAULT_FIELDS)
+
+
+def _normalize_inventory_number(inventory_number: str) -> str:
+    """Normalize an inventory number for matching Filemaker records to requests.
+
+    :param str inventory_number: An inventory number.
+    :return: The inventory number, stripped of surrounding whitespace and case-folded.
+    """
+    return inventory_number.strip().casefold()
+
 
 class FilemakerClient:
     def __init__(
@@ -44,30 +85,6 @@ class FilemakerClient:
         )
         self._fms.login()
 
-    @property
-    def _default_fields(self) -> list[str]:
-        return [
-            "Acquisition type",
-            "Alma",
-            "aka",
-            "availability",
-            "director",
-            "donor_code",
-            "element_info",
-            "episode no.",
-            "episode_title",
-            "film base",
-            "format_type",
-            "inventory_id",
-            "inventory_no",
-            "notes",
-            "production_type",
-            "release_broadcast_year",
-            "spac",
-            "title",
-            "type",
-        ]
-
     def search_by_inventory_number(self, inventory_number: str) -> list[Record]:
 
         records = self._search_filemaker(
@@ -75,6 +92,52 @@ class FilemakerClient:
         )
         return records
 
+    def search_by_inventory_numbers(
+        self, inventory_numbers: Iterable[str], chunk_size: int = 100
+    ) -> dict[str, list[Record]]:
+        """Search Filemaker for records matching each of the given inventory numbers.
+
+        Inventory numbers are sent in chunks, one find request (with one OR-ed criterion
+        per inventory number) per chunk, rather than one request per inventory number.
+
+        :param Iterable[str] inventory_numbers: The inventory numbers to search for.
+        :param int chunk_size: The maximum number of inventory numbers per request.
+            Default: 100.
+        :return: A dict mapping each requested inventory number to a list of
+            matching Filemaker records, in the order requested.
+            Inventory numbers with no matches map to an empty list.
+        """
+        # Remove duplicates, while keeping the requested order.
+        results: dict[str, list[Record]] = {
+            inventory_number: [] for inventory_number in inventory_numbers
+        }
+        # Filemaker's exact match ignores case, and records may have stray whitespace,
+        # so map found records back to requests by normalized inventory number.
+        # Requests differing only by case or whitespace share a key, and each gets
+        # the matching records; each key is queried only once.
+        requested_by_key: dict[str, list[str]] = {}
+        for inventory_number in results:
+            requested_by_key.setdefault(
+                _normalize_inventory_number(inventory_number), []
+            ).append(inventory_number)
+        for chunk in batched(requested_by_key.values(), chunk_size):
+            # Use Filemaker syntax for exact match (==) in each criterion.
+            query = [{"inventory_no": f"=={requested[0]}"} for requested in chunk]
+            for record in self.find_all_records(query, date_format="iso-8601"):
+                requested = requested_by_key.get(
+                    _normalize_inventory_number(record["inventory_no"])
+                )
+                if requested is None:
+                    logger.warning(
+                        f"Filemaker record with inventory number "
+                        f"'{record['inventory_no']}' does not match any requested "
+                        "inventory number."
+                    )
+                    continue
+                for inventory_number in requested:
+                    results[inventory_number].append(record)
+        return results
+
     def get_fields(
         self, fm_record: Record, field_list: list[str] | None = None
     ) -> dict:
@@ -86,13 +149,21 @@ class FilemakerClient:
         :return: A dict with the specific fields from the Filemaker Record.
         Fields are only included if they exist in the Record.
         """
+        # Build the record's dict once, rather than once per field.
+        record_data = fm_record.to_dict()
+
         if field_list is None:
-            field_list = self._default_fields
+            # Records normally have all of the default fields,
+            # so get them all at once, falling back to checking each field if not.
+            try:
+                return dict(
+                    zip(_DEFAULT_FIELDS, _get_default_field_values(record_data))
+                )
+            except KeyError:
+                field_list = _DEFAULT_FIELDS
 
         return {
-            field: fm_record[field]
-            for field in field_list
-            if field in fm_record.to_dict()
+            field: record_data[field] for field in field_list if field in record_data
         }
 
     def get_record(self, record_id: int, **kwargs) -> Record | None:
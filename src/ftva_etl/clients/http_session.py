@@ -0,0 +1,39 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def create_session(
+    auth: tuple[str, str] | None = None, pool_maxsize: int = 32
+) -> requests.Session:
+    """Create a requests Session with pooled, keep-alive connections.
+
+    Reusing one session for repeated requests to the same host avoids setting up
+    a new TCP/TLS connection (and re-applying auth) for every request.
+
+    :param auth: Optional (user, password) tuple for HTTP basic auth.
+    :param pool_maxsize: Maximum number of connections kept open per host.
+    Should be at least the number of threads sharing the session.
+    :return: A configured requests Session.
+    """
+    session = requests.Session()
+    session.auth = auth
+
+    # Retry rate limiting and transient server errors on GET requests,
+    # with exponential backoff (honoring any Retry-After header),
+    # so one flaky response doesn't fail a whole batch.
+    # raise_on_status=False hands the final response back to the caller,
+    # so raise_for_status() still raises HTTPError if all retries fail.
+    retries = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retries
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
@@ -1,8 +1,70 @@
 # Code which extracts data from a Digital Data record.
 # Minimal for now.
+from dataclasses import dataclass
 from uuid import UUID
 
 
+@dataclass(slots=True, frozen=True)
+class DigitalDataView:
+    """The simple fields of a Digital Data record, read once per record.
+
+    Build with `DigitalDataView.from_record()`, then read fields as attributes,
+    rather than calling a getter function for each field.
+    """
+
+    record_id: int
+    uuid: UUID | str
+    file_name: str
+    folder_name: str
+    sub_folder_name: str
+    file_type: str
+    asset_type: str
+    media_type: str
+    audio_class: str
+
+    @classmethod
+    def from_record(cls, dd_record: dict) -> "DigitalDataView":
+        """Extract the simple fields from a Digital Data record.
+
+        :param dd_record: A Digital Data record
+        :return: A DigitalDataView, with defaults for any missing fields.
+        """
+        return cls(
+            record_id=dd_record.get("id", 0),
+            uuid=dd_record.get("uuid", ""),
+            file_name=dd_record.get("file_name", ""),
+            folder_name=dd_record.get("file_folder_name", ""),
+            sub_folder_name=dd_record.get("sub_folder_name", ""),
+            file_type=dd_record.get("file_type", ""),
+            asset_type=dd_record.get("asset_type", ""),
+            media_type=dd_record.get("media_type", ""),
+            audio_class=dd_record.get("audio_class", ""),
+        )
+
+    def get_file_type_info(self) -> dict:
+        """Return the bundle of fields required for DCP or DPX files.
+
+        :return: A dictionary of fields, or an empty dictionary
+            if the file type is neither DCP nor DPX.
+        """
+        if self.file_type == "DCP":
+            return {
+                # File name must always be empty for DCPs.
+                "file_name": "",
+                "folder_name": self.folder_name,
+                "sub_folder_name": self.sub_folder_name,
+                "file_type": "DCP",  # file type required by MAMS for DCP files
+            }
+        if self.file_type == "DPX":
+            return {
+                # File name must always be empty for DPXs.
+                "file_name": "",
+                "folder_name": self.folder_name,
+                "file_type": "DPX",  # file type required by MAMS for DPX files
+            }
+        return {}
+
+
 def get_file_name(dd_record: dict) -> str:
     return dd_record.get("file_name", "")
 
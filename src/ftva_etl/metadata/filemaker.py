@@ -11,6 +11,11 @@ from warnings import deprecated
 # Create a module logger, which will be a child of the package logger
 logger = logging.getLogger(__name__)
 
+# Production types which represent a series, as defined in FTVA specs.
+_SERIES_PRODUCTION_TYPES = frozenset(
+    ["television series", "mini-series", "serials", "news"]
+)
+
 
 @deprecated(
     "Use `get_inventory_ids()` instead, as MAMS expects `inventory_ids: list[str]`"
@@ -71,9 +76,8 @@ def is_series_production_type(fm_inventory_record: Record) -> bool:
     """
 
     production_type = cleanup_production_type(fm_inventory_record.production_type)
-    series_keywords = ["television series", "mini-series", "serials", "news"]
-    # Look for any of the keywords in the production type list
-    return any(keyword in production_type for keyword in series_keywords)
+    # Look for any of the series production types in the production type list
+    return not _SERIES_PRODUCTION_TYPES.isdisjoint(production_type)
 
 
 def get_creators(fm_inventory_record: Record) -> list:
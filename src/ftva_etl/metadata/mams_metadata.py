@@ -1,18 +1,12 @@
-import spacy
 import logging
 
+from collections.abc import Iterable
 from fmrest.record import Record as FM_Record
 from pymarc import Record as Pymarc_Record
 from typing import Optional
 from spacy.language import Language
 from .digital_data import (
-    get_asset_type,
-    get_dcp_info,
-    get_dpx_info,
-    get_file_name,
-    get_media_type,
-    get_uuid,
-    get_audio_class,
+    DigitalDataView,
     get_record_type_and_match_asset,
 )
 from .filemaker import (
@@ -25,11 +19,9 @@ from .filemaker import (
     get_title_info as get_fm_title_info,
 )
 from .marc import (
-    get_bib_id,
-    get_creators as get_alma_creators,
-    get_date_info as get_alma_date_info,
-    get_language_name as get_alma_language_name,
-    get_title_info as get_alma_title_info,
+    get_bib_metadata,
+    load_ner_model,
+    get_creators_batch as get_alma_creators_batch,
 )
 
 
@@ -38,7 +30,10 @@ logger = logging.getLogger(__name__)
 
 
 def get_alma_metadata(
-    bib_record: Pymarc_Record, nlp_model: Language, is_series: bool = False
+    bib_record: Pymarc_Record,
+    nlp_model: Language,
+    is_series: bool = False,
+    creators: Optional[list] = None,
 ) -> dict:
     """Get the Alma metadata from a pymarc record.
 
@@ -46,17 +41,11 @@ def get_alma_metadata(
     :param nlp_model: A spacy language model to use for NER.
     :param is_series: Whether the record is a series, derived from Filemaker record.
         Defaults to False.
+    :param creators: Creators already parsed from the record, e.g. in a batch.
+        If not provided, creators are parsed from the record using `nlp_model`.
     :return: A dict containing the Alma metadata needed for the MAMS.
     """
-    # This gets a collection of titles which will be unpacked later.
-    titles = get_alma_title_info(bib_record, is_series)
-    return {
-        "alma_bib_id": get_bib_id(bib_record),
-        "language": get_alma_language_name(bib_record),
-        "creators": get_alma_creators(bib_record, nlp_model),
-        **titles,
-        **get_alma_date_info(bib_record),
-    }
+    return get_bib_metadata(bib_record, nlp_model, is_series, creators)
 
 
 def get_filemaker_metadata(filemaker_record: FM_Record, is_series: bool) -> dict:
@@ -114,13 +103,78 @@ def get_mams_metadata(
     :param bib_record: A pymarc record, expected to contain bibliographic data.
         Optional to support multiple types of matching (e.g. DD-FM-Alma or DD-FM only).
     :param nlp_model: A spacy language model to use for NER.
-        If not provided, the default spacy model (en_core_web_md) will be used.
+        If not provided, the default spacy model (en_core_web_md) will be used,
+        loaded once and reused across calls.
     :return: A dict containing the metadata formatted for output to the MAMS.
     """
-    # Allow caller to provide the spacy model, to avoid loading it on every call
+    # A single record is just a batch of one.
+    return get_mams_metadata_batch(
+        [(digital_data_record, filemaker_record, bib_record)], nlp_model
+    )[0]
+
+
+def get_mams_metadata_batch(
+    records: Iterable[tuple[dict, FM_Record, Optional[Pymarc_Record]]],
+    nlp_model: Optional[Language] = None,
+) -> list[dict]:
+    """Format the source metadata for many records for output to the MAMS.
+
+    Gives the same results as calling `get_mams_metadata()` on each record,
+    but creators are parsed from all of the bib records in a single NER batch,
+    which is much faster for large numbers of records.
+
+    :param records: Tuples of (digital data record, filemaker record, bib record),
+        as would be passed to `get_mams_metadata()`. The bib record may be None.
+    :param nlp_model: A spacy language model to use for NER.
+        If not provided, the default spacy model (en_core_web_md) will be used,
+        loaded once and reused across calls.
+    :return: A list of dicts containing the metadata formatted for output to the MAMS,
+        in the same order as `records`.
+    :raises ValueError: If any bib record has no title statement (245 field)
+        or main title (245$a). This aborts the whole batch, and no results are returned;
+        callers needing partial results should validate records first,
+        or process them with `get_mams_metadata()` one at a time.
+    """
+    # Allow caller to provide the spacy model; otherwise use the default model,
+    # which is only loaded on the first call.
     if not nlp_model:
-        nlp_model = spacy.load("en_core_web_md")
+        nlp_model = load_ner_model()
+
+    records = list(records)
+    bib_records = [bib_record for _, _, bib_record in records if bib_record]
+    # Results are in the same order as `bib_records`,
+    # so consume them in order as records with bib data come up.
+    alma_creators = iter(get_alma_creators_batch(bib_records, nlp_model))
+
+    return [
+        _format_mams_metadata(
+            digital_data_record,
+            filemaker_record,
+            bib_record,
+            nlp_model,
+            alma_creators=next(alma_creators) if bib_record else None,
+        )
+        for digital_data_record, filemaker_record, bib_record in records
+    ]
+
+
+def _format_mams_metadata(
+    digital_data_record: dict,
+    filemaker_record: FM_Record,
+    bib_record: Optional[Pymarc_Record],
+    nlp_model: Language,
+    alma_creators: Optional[list] = None,
+) -> dict:
+    """Format the source metadata for a single record for output to the MAMS.
+    See `get_mams_metadata()` for details.
 
+    :param digital_data_record: A dict containing an FTVA digital data record.
+    :param filemaker_record: A fmrest filemaker record.
+    :param bib_record: A pymarc record, expected to contain bibliographic data, or None.
+    :param nlp_model: A spacy language model to use for NER.
+    :param alma_creators: Creators already parsed from `bib_record`, if available.
+    :return: A dict containing the metadata formatted for output to the MAMS.
+    """
     # Used by both Filemaker and Alma metadata functions for determining how to format title info.
     # Filemaker is the source-of-truth for whether something is a series.
     is_series = is_series_production_type(filemaker_record)
@@ -128,19 +182,22 @@ def get_mams_metadata(
     filemaker_metadata = get_filemaker_metadata(filemaker_record, is_series)
 
     alma_metadata = (
-        get_alma_metadata(bib_record, nlp_model, is_series) if bib_record else {}
+        get_alma_metadata(bib_record, nlp_model, is_series, alma_creators)
+        if bib_record
+        else {}
     )
 
     # These are all the fields derived from the Digital Data app
+    digital_data = DigitalDataView.from_record(digital_data_record)
     digital_data_fields = {
-        "uuid": get_uuid(digital_data_record),
-        "file_name": get_file_name(digital_data_record),
-        "asset_type": get_asset_type(digital_data_record),
-        "media_type": get_media_type(digital_data_record),
-        "audio_class": get_audio_class(digital_data_record),
+        "uuid": digital_data.uuid,
+        "file_name": digital_data.file_name,
+        "asset_type": digital_data.asset_type,
+        "media_type": digital_data.media_type,
+        "audio_class": digital_data.audio_class,
         **get_record_type_and_match_asset(digital_data_record),
-        **get_dcp_info(digital_data_record),  # returns DCP fields if file type is DCP
-        **get_dpx_info(digital_data_record),  # returns DPX fields if file type is DPX
+        # Returns DCP or DPX fields if file type is DCP or DPX
+        **digital_data.get_file_type_info(),
     }
 
     # These are the fields from Filemaker
@@ -1,5 +1,3 @@
-import spacy
-
 from fmrest.record import Record as FM_Record
 from pymarc import Record as Pymarc_Record
 from typing import Optional
@@ -20,13 +18,7 @@ from .filemaker import (
     get_audio_class,
     get_file_path_info,
 )
-from .marc import (
-    get_bib_id,
-    get_creators as get_alma_creators,
-    get_date_info as get_alma_date_info,
-    get_language_name as get_alma_language_name,
-    get_title_info as get_alma_title_info,
-)
+from .marc import get_bib_metadata, load_ner_model
 
 
 def get_mams_metadata_ndm(
@@ -44,12 +36,14 @@ def get_mams_metadata_ndm(
         Optional to support multiple types of matching (e.g. FM-Alma or FM only).
     :param match_asset: A string representation of the UUID for a related asset, if this is a track.
     :param nlp_model: A spacy language model to use for NER.
-        If not provided, the default spacy model (en_core_web_md) will be used.
+        If not provided, the default spacy model (en_core_web_md) will be used,
+        loaded once and reused across calls.
     :return: A dict containing the metadata formatted for output to the MAMS.
     """
-    # Allow caller to provide the spacy model, to avoid loading it on every call
+    # Allow caller to provide the spacy model; otherwise use the default model,
+    # which is only loaded on the first call.
     if not nlp_model:
-        nlp_model = spacy.load("en_core_web_md")
+        nlp_model = load_ner_model()
 
     # Used by both Filemaker and Alma metadata functions for determining how to format title info.
     # Filemaker is the source-of-truth for whether something is a series.
@@ -77,13 +71,7 @@ def get_mams_metadata_ndm(
     }
 
     alma_metadata = (
-        {
-            "alma_bib_id": get_bib_id(alma_bib_record),
-            "language": get_alma_language_name(alma_bib_record),
-            "creators": get_alma_creators(alma_bib_record, nlp_model),
-            **get_alma_title_info(alma_bib_record, is_series),
-            **get_alma_date_info(alma_bib_record),
-        }
+        get_bib_metadata(alma_bib_record, nlp_model, is_series)
         if alma_bib_record
         else {}
     )
@@ -1,17 +1,54 @@
 import json
 import logging
+import os
+import re
+import spacy
+from cachetools import LRUCache
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import batched
 from importlib.resources import open_text
 from pymarc import Record
-from .utils import parse_date, strip_whitespace_and_punctuation
+from types import MappingProxyType
+from .utils import parse_date, strip_item_whitespace_and_punctuation
 
 # for type hinting
 from spacy.language import Language
+from spacy.tokens import Doc
 
 # Create a module logger, which will be a child of the package logger
 logger = logging.getLogger(__name__)
 
+# Default number of strings spacy processes per batch for creator NER.
+# Can be tuned per deployment via the FTVA_ETL_NER_BATCH_SIZE environment variable;
+# see `_get_ner_batch_size()`.
+NER_BATCH_SIZE = 256
+_NER_BATCH_SIZE_VARIABLE = "FTVA_ETL_NER_BATCH_SIZE"
+
 
 # region Dates
+# MARC 260 fields with both indicators blank hold the release_broadcast_date.
+_BLANK_INDICATORS = (" ", " ")
+# MARC 264 second indicators, mapped to their order of preference for dates:
+# 2 = distribution date
+# 1 = publication date (write as release_broadcast_date)
+# 4 = copyright notice date (write as copyright_date)
+# 0 = production date
+# 3 = manufacture date
+_264_INDICATOR_PRIORITY = MappingProxyType({"2": 0, "1": 1, "4": 2, "0": 3, "3": 4})
+# MARC 264 second indicators, mapped to the qualifier for their date.
+_264_QUALIFIERS = MappingProxyType(
+    {
+        "2": "distribution_date",
+        "1": "release_broadcast_date",
+        "4": "copyright_date",
+        "0": "production_date",
+        "3": "manufacture_date",
+    }
+)
+
+
 def get_date_info(bib_record: Record) -> dict:
     """Extract and format dates and qualifiers from a MARC bib record.
 
@@ -39,43 +76,39 @@ def _get_date_from_bib(bib_record: Record) -> dict:
     """
     # First, check for MARC 260 $c with both indicators blank.
     # This will be a release_broadcast_date.
-    fields_260 = bib_record.get_fields("260")
-    if fields_260:
-        for field in fields_260:
-            if field.indicator1 == " " and field.indicator2 == " ":
-                date_subfield = field.get_subfields("c")
-                if date_subfield:
-                    return {
-                        "date": date_subfield[0].strip(),
-                        "qualifier": "release_broadcast_date",
-                    }
-    # Next, check for any MARC 264 $c with first indicator blank.
-    fields_264 = bib_record.get_fields("264")
-    if any(field.indicator1 == " " for field in fields_264):
-        # Now, check second indicators in order of preference:
-        # 2 = distribution date
-        # 1 = publication date (write as release_broadcast_date)
-        # 4 = copyright notice date (write as copyright_date)
-        # 0 = production date
-        # 3 = manufacture date
-        indicator_priority = ["2", "1", "4", "0", "3"]
-        qualifier_map = {
-            "2": "distribution_date",
-            "1": "release_broadcast_date",
-            "4": "copyright_date",
-            "0": "production_date",
-            "3": "manufacture_date",
-        }
-        for indicator in indicator_priority:
-            for field in fields_264:
-                if field.indicator1 == " " and field.indicator2 == indicator:
-                    date_subfields = field.get_subfields("c")
-                    # If there are multiple 264 $c, take the first one.
-                    if date_subfields:
-                        return {
-                            "date": date_subfields[0].strip(),
-                            "qualifier": qualifier_map[indicator],
-                        }
+    for field in bib_record.get_fields("260"):
+        # Compare both indicators at once, rather than via the indicator1/2 properties.
+        if field.indicators == _BLANK_INDICATORS:
+            date_subfield = field.get_subfields("c")
+            if date_subfield:
+                return {
+                    "date": date_subfield[0].strip(),
+                    "qualifier": "release_broadcast_date",
+                }
+    # Next, check for any MARC 264 $c with first indicator blank,
+    # using second indicators in the order of preference in _264_INDICATOR_PRIORITY.
+    # Find the most preferred field in a single pass; for fields with
+    # the same second indicator, the first one in the record wins.
+    best_priority = len(_264_INDICATOR_PRIORITY)
+    best_date = {}
+    for field in bib_record.get_fields("264"):
+        if field.indicator1 != " ":
+            continue
+        priority = _264_INDICATOR_PRIORITY.get(field.indicator2, best_priority)
+        if priority >= best_priority:
+            continue
+        date_subfields = field.get_subfields("c")
+        # If there are multiple 264 $c, take the first one.
+        if date_subfields:
+            best_priority = priority
+            best_date = {
+                "date": date_subfields[0].strip(),
+                "qualifier": _264_QUALIFIERS[field.indicator2],
+            }
+            if priority == 0:
+                break  # Nothing can be preferred over this field.
+    if best_date:
+        return best_date
     # Finally, if no date found in 260 or 264, check 008 position 7-10.
     field_008 = bib_record.get("008")
     if field_008:
@@ -99,6 +132,38 @@ def _get_date_from_bib(bib_record: Record) -> dict:
 
 
 # region Creators
+# Components of the trained English pipelines which creator NER doesn't use.
+_NON_NER_COMPONENTS = ("tagger", "parser", "attribute_ruler", "lemmatizer")
+
+
+@lru_cache(maxsize=1)
+def load_ner_model(name: str = "en_core_web_md") -> Language:
+    """Load a spacy language model for creator NER, once per process.
+
+    Loading a model takes several seconds, so the result is cached and the
+    same model is returned on later calls. Components not needed for NER
+    (tagger, parser, attribute_ruler and lemmatizer) are excluded, so they are
+    never loaded into memory or run on any text.
+
+    NOTE: spacy models are not thread-safe; use one process per worker
+    for parallel processing, rather than sharing the model across threads.
+
+    The strings processed are short 245 $c statements, so the smaller
+    en_core_web_sm model is a reasonable choice where memory is limited
+    (e.g. many worker processes). Large (_lg) and transformer (_trf) models
+    cost much more memory and time, for little benefit on this data.
+
+    :param name: Name of the spacy model to load. Defaults to en_core_web_md.
+    :return: The loaded spacy language model.
+    """
+    if name.endswith(("_lg", "_trf")):
+        logger.warning(
+            f"Loading {name} for creator NER; en_core_web_sm or en_core_web_md "
+            "are much faster, with similar results on 245$c statements."
+        )
+    return spacy.load(name, exclude=_NON_NER_COMPONENTS)
+
+
 def _get_creator_info_from_bib(bib_record: Record) -> list[str]:
     """Extract creators from the MARC bib record.
 
@@ -115,69 +180,263 @@ def _get_creator_info_from_bib(bib_record: Record) -> list[str]:
     return creators
 
 
-def _parse_creators(source_string: str, model: Language) -> list[str]:
-    """Given a string sourced from MARC data, parse it to extract creator names.
-    First, a list of attribution phrases is checked to see if the string
-    contains any of them. If it does, the substring following the phrase
-    is processed with a spacy NER model to extract names.
+# Phrases in 245 $c which indicate the string names a creator.
+_ATTRIBUTION_PHRASES = (
+    "directed by",
+    "directed and written by",
+    "director",  # This will also match "directors" or "producer-director"
+    "a film by",
+    "supervised by",
+)
+_ATTRIBUTION_ALTERNATIVES = "|".join(
+    re.escape(phrase) for phrase in _ATTRIBUTION_PHRASES
+)
+_ATTRIBUTION_PATTERN = re.compile(_ATTRIBUTION_ALTERNATIVES, re.IGNORECASE)
+
+# If True, names are found in creator strings with `_find_names()` where possible,
+# and NER is only used for strings where it cannot find names with confidence.
+# This is much faster, but less accurate than NER for unusual names, so is off by default.
+USE_LAZY_NER = False
+# A name of 2 to 4 capitalized words, e.g. "John Director" or "Jean-Luc Godard".
+# Each word must end in a letter, digit or period, so partial words like "Co-" don't match.
+_NAME_PATTERN = re.compile(r"[A-Z][\w.'-]*[\w.](?:\s+[A-Z][\w.'-]*[\w.]){1,3}")
+# Capitalized words which indicate a credit or title, rather than part of a name.
+_NON_NAME_WORDS = frozenset(("And", "By", "For", "Of", "The", "With"))
+# Separators between names attributed by the same phrase.
+_NAME_SEPARATOR_PATTERN = re.compile(r"\s*(?:[,&]|\band\b)\s*")
+_NAME_STRIP_CHARS = " .:"
+
+
+def _get_creator_string(source_string: str) -> str:
+    """Check a string sourced from MARC data for attribution phrases,
+    to decide whether it should be processed with a spacy NER model.
 
     :param source_string: String containing creator names from MARC data.
-    :param model: Spacy language model for NER.
-    :return: List of creator names."""
+    :return: The string to process with NER, or an empty string
+    if no attribution phrase is found, or the string is a single word."""
 
-    # Initialize an empty string for the creator string
-    creator_string = ""
+    # Check for all attribution phrases in a single case-insensitive scan.
+    if _ATTRIBUTION_PATTERN.search(source_string):
+        creator_string = source_string.strip()
+        # A string of one word (e.g. "Directors.") has no room for a name
+        # as well as the phrase, so is not worth processing with NER.
+        if len(creator_string.split(maxsplit=1)) > 1:
+            return creator_string
 
-    attribution_phrases = [
-        "directed by",
-        "directed and written by",
-        "director",  # This will also match "directors" or "producer-director"
-        "a film by",
-        "supervised by",
-    ]
+    # If no attribution phrase is found, return an empty string.
+    return ""
 
-    # Find the first attribution phrase in the source string,
-    # and set the creator string for processing by the NER model.
-    for phrase in attribution_phrases:
-        if phrase in source_string.lower():
-            creator_string = source_string.strip()
-            break
 
-    # If no attribution phrase is found, return an empty list.
-    if not creator_string:
-        return []
+def _extract_creator_substrings(source_strings: list[str]) -> list[str]:
+    """Get the strings to process with NER from a list of strings sourced from MARC data.
 
-    doc = model(creator_string)
-    return [ent.text for ent in doc.ents]
+    :param source_strings: Strings potentially containing creator names.
+    :return: The strings which contain an attribution phrase, stripped,
+    in their original order."""
+    creator_strings = map(_get_creator_string, source_strings)
+    return [creator_string for creator_string in creator_strings if creator_string]
 
 
-def get_creators(bib_record: Record, model: Language) -> list:
-    """Extract and parse creator names from a MARC bib record.
+def _find_names(creator_string: str) -> tuple[str, ...]:
+    """Find names in a creator string with regular expressions, without NER.
+
+    Only segments (separated by semicolons) containing an attribution phrase are used.
+    After removing the phrase, each remaining piece, separated by commas, "&" or "and",
+    must be a name of 2 to 4 capitalized words. If any piece is not, the string is too
+    complex to parse this way (e.g. it contains other credits), and nothing is returned.
+
+    :param creator_string: String containing an attribution phrase, from MARC data.
+    :return: Tuple of names, in the order they occur in the string,
+    or an empty tuple if the string should be processed with NER instead."""
+    names = []
+    for segment in creator_string.split(";"):
+        if not _ATTRIBUTION_PATTERN.search(segment):
+            continue
+        without_phrases = _ATTRIBUTION_PATTERN.sub(" ", segment)
+        for piece in _NAME_SEPARATOR_PATTERN.split(without_phrases):
+            piece = piece.strip(_NAME_STRIP_CHARS)
+            if not piece:
+                continue
+            if not _NAME_PATTERN.fullmatch(piece) or not _NON_NAME_WORDS.isdisjoint(
+                piece.split()
+            ):
+                return ()
+            names.append(piece)
+    return tuple(names)
+
+
+def _get_entity_names(doc: Doc) -> tuple[str, ...]:
+    """Get the names of the entities found by NER in a creator string.
+
+    :param doc: Spacy Doc for a creator string, processed with an NER model.
+    :return: Tuple of entity names, in the order they occur in the string."""
+    return tuple(ent.text for ent in doc.ents)
+
+
+# Fewest strings per process for `get_creators_batch()` to run NER in multiple processes.
+_MIN_STRINGS_PER_PROCESS = 128
+
+# Creators parsed from each string, keyed by (model, string), shared across calls.
+_parsed_creators_cache: LRUCache = LRUCache(maxsize=65_536)
+
+
+def clear_creators_cache() -> None:
+    """Clear the cache of creators parsed by NER, e.g. between ETL runs.
+    The cache holds a reference to each model used, until it is cleared."""
+    _parsed_creators_cache.clear()
+
+
+def _log_unparsed_creators(
+    bib_record: Record, creators: list[str], parsed_creators: list[str]
+) -> None:
+    """Log a message if 245$c contains a value, but no creators can be parsed.
+    This is to facilitate manual review of the record for unanticipated attribution phrases.
 
     :param bib_record: Pymarc Record object containing the bib data.
-    :param model: Spacy language model for NER.
-    :return: List of parsed creator names."""
-    creators = _get_creator_info_from_bib(bib_record)
-    parsed_creators = []
-    for creator in creators:
-        parsed_creators.extend(_parse_creators(creator, model))
-    # Log a message if 245$c contains a value, but no creators can be parsed.
-    # This is to facilitate manual review of the record for unanticipated attribution phrases.
+    :param creators: List of strings potentially containing creator names.
+    :param parsed_creators: List of parsed creator names."""
     if creators and not parsed_creators:
         logger.info(
             f"Field 245$c on MMS ID {get_record_id(bib_record)} contains a value, "
             f"but no creators could be parsed. 245$c values: {creators}"
         )
-    return parsed_creators
+
+
+def _get_ner_batch_size() -> int:
+    """Get the default NER batch size, from the environment if set.
+    Read on each call, so a bad value only fails when creators are parsed,
+    not when the package is imported.
+
+    :return: The batch size from FTVA_ETL_NER_BATCH_SIZE, or `NER_BATCH_SIZE` if not set.
+    :raises ValueError: If FTVA_ETL_NER_BATCH_SIZE is set, but is not a positive integer.
+    """
+    value = os.environ.get(_NER_BATCH_SIZE_VARIABLE)
+    if value is None:
+        return NER_BATCH_SIZE
+    try:
+        batch_size = int(value)
+    except ValueError:
+        batch_size = 0
+    if batch_size < 1:
+        raise ValueError(
+            f"{_NER_BATCH_SIZE_VARIABLE} must be a positive integer, not '{value}'."
+        )
+    return batch_size
+
+
+def get_creators(bib_record: Record, model: Language) -> list:
+    """Extract and parse creator names from a MARC bib record.
+
+    To parse creators from many records, use `get_creators_batch()` instead.
+
+    :param bib_record: Pymarc Record object containing the bib data.
+    :param model: Spacy language model for NER. Only its entities are used,
+    so it should be an NER-only pipeline, as returned by `load_ner_model()`.
+    :return: List of parsed creator names."""
+    return get_creators_batch([bib_record], model)[0]
+
+
+def get_creators_batch(
+    bib_records: Iterable[Record],
+    model: Language,
+    batch_size: int | None = None,
+    n_process: int = 1,
+) -> list[list]:
+    """Extract and parse creator names from many MARC bib records at once.
+
+    Gives the same results as calling `get_creators()` on each record,
+    but all creator strings are processed by the NER model in batches,
+    which is much faster than processing them one at a time.
+
+    :param bib_records: Pymarc Record objects containing the bib data.
+    :param model: Spacy language model for NER. Only its entities are used,
+    so it should be an NER-only pipeline, as returned by `load_ner_model()`.
+    The tagger, parser, attribute_ruler and lemmatizer are skipped if present.
+    :param batch_size: Number of strings for spacy to process in each batch.
+    Defaults to the FTVA_ETL_NER_BATCH_SIZE environment variable if set,
+    otherwise `NER_BATCH_SIZE`.
+    :param n_process: Number of processes for spacy to run NER in. Only used if there
+    are more than `_MIN_STRINGS_PER_PROCESS` strings to parse per process,
+    since starting the processes is slow. Defaults to 1, i.e. the current process.
+    :return: List of parsed creator names for each record, in the same order
+    as `bib_records`.
+    :raises ValueError: If FTVA_ETL_NER_BATCH_SIZE is set, but is not a positive integer.
+    """
+    if batch_size is None:
+        batch_size = _get_ner_batch_size()
+
+    bib_records = list(bib_records)
+    creators_by_record = [_get_creator_info_from_bib(record) for record in bib_records]
+
+    # Only strings with an attribution phrase are processed with NER.
+    creator_strings_by_record = [
+        _extract_creator_substrings(creators) for creators in creators_by_record
+    ]
+
+    # 245 $c statements are often repeated across records (e.g. episodes of a series),
+    # so each distinct string is processed once, and results are cached across calls.
+    parsed_by_string: dict[str, tuple[str, ...]] = {}
+    strings_to_parse = []
+    for creator_string in dict.fromkeys(
+        creator_string
+        for creator_strings in creator_strings_by_record
+        for creator_string in creator_strings
+    ):
+        # Optionally, try a cheap regex for names before falling back to NER.
+        if USE_LAZY_NER:
+            names = _find_names(creator_string)
+            if names:
+                parsed_by_string[creator_string] = names
+                continue
+        cached = _parsed_creators_cache.get((model, creator_string))
+        if cached is None:
+            strings_to_parse.append(creator_string)
+        else:
+            parsed_by_string[creator_string] = cached
+    if len(strings_to_parse) <= n_process * _MIN_STRINGS_PER_PROCESS:
+        n_process = 1
+    for creator_string, doc in zip(
+        strings_to_parse,
+        # In case the model wasn't loaded by `load_ner_model()`,
+        # skip any components not needed for NER.
+        model.pipe(
+            strings_to_parse,
+            batch_size=batch_size,
+            disable=_NON_NER_COMPONENTS,
+            n_process=n_process,
+        ),
+    ):
+        parsed = _get_entity_names(doc)
+        parsed_by_string[creator_string] = parsed
+        _parsed_creators_cache[(model, creator_string)] = parsed
+
+    parsed_creators_by_record = [
+        [
+            creator
+            for creator_string in creator_strings
+            for creator in parsed_by_string[creator_string]
+        ]
+        for creator_strings in creator_strings_by_record
+    ]
+
+    for record, creators, parsed_creators in zip(
+        bib_records, creators_by_record, parsed_creators_by_record
+    ):
+        _log_unparsed_creators(record, creators, parsed_creators)
+    return parsed_creators_by_record
 
 
 # endregion
 
 
 # region Languages
+@lru_cache(maxsize=4)
 def _get_language_map(file_name: str = "language_map.json") -> dict:
     """Load the language map from a file.
 
+    The file is only read once; later calls return the same dict,
+    so callers must not modify it.
+
     :param file_name: name of the language map file, with no extra path info.
     :return: Dictionary with language code:name data.
     """
@@ -215,6 +474,18 @@ def _get_language_code_from_bib(bib_record: Record) -> str:
     return language_code
 
 
+@lru_cache(maxsize=512)
+def _lookup_language(language_code: str) -> str:
+    """Get the full name of a MARC language code, caching the result.
+
+    :param language_code: The 3-letter MARC language code.
+    :return: The full name of the language, or an empty string if the code is not mapped.
+    """
+    # TODO: should this be hard-coded? We'll only have 1;
+    # regenerate it if missing?
+    return _get_language_map().get(language_code, "")
+
+
 def get_language_name(bib_record: Record) -> str:
     """Get the full name of the language in a MARC bib record.
 
@@ -223,13 +494,9 @@ def get_language_name(bib_record: Record) -> str:
     :return language_name: The full name of the language.
     """
 
-    # Load language mapping data.
-    # TODO: should this be hard-coded? We'll only have 1;
-    # regenerate it if missing?
-    language_map = _get_language_map()
-
     language_code = _get_language_code_from_bib(bib_record)
-    language_name = language_map.get(language_code, "")
+    # Map lookups are cached by code, since most records share a few languages.
+    language_name = _lookup_language(language_code)
     # TODO: LOGGING
     # if not language_name:
     #     logging.warning(
@@ -262,14 +529,21 @@ def get_title_info(bib_record: Record, is_series: bool = False) -> dict:
 
     # Specs say to strip whitespace and punctuation from subfields,
     # then take first item if there are multiple.
-    def _get_first_stripped(subfields: list[str]) -> str:
-        stripped = strip_whitespace_and_punctuation(subfields)
-        return stripped[0] if stripped else ""
-
-    main_title = _get_first_stripped(title_statement.get_subfields("a"))
-    remainder_of_title = _get_first_stripped(title_statement.get_subfields("b"))
-    name_of_part = _get_first_stripped(title_statement.get_subfields("p"))
-    number_of_part = _get_first_stripped(title_statement.get_subfields("n"))
+    # Only the first item is used, so collect the first value of each subfield
+    # in a single pass over the field, then strip just those values.
+    first_values: dict[str, str] = {}
+    for subfield in title_statement.subfields:
+        first_values.setdefault(subfield.code, subfield.value)
+
+    def _get_first_stripped(code: str) -> str:
+        if code not in first_values:
+            return ""
+        return strip_item_whitespace_and_punctuation(first_values[code])
+
+    main_title = _get_first_stripped("a")
+    remainder_of_title = _get_first_stripped("b")
+    name_of_part = _get_first_stripped("p")
+    number_of_part = _get_first_stripped("n")
 
     # Handling the spec cases in reverse order,
     # to fail early and go from simplest to most complicated.
@@ -285,28 +559,30 @@ def get_title_info(bib_record: Record, is_series: bool = False) -> dict:
     if remainder_of_title:
         main_title = ". ".join([main_title, remainder_of_title])
 
+    # The remaining cases are mutually exclusive, and main_title is always present,
+    # so only the first matching case needs to be checked.
     # CASE 5: Main title, but no name of part or number of part
-    if main_title and not name_of_part and not number_of_part:
+    if not name_of_part and not number_of_part:
         titles["title"] = main_title  # 245 $a (+ 245 $b, if present)
 
     # CASE 4: Main title and number of part, but no name of part (for non-series)
-    if not is_series and main_title and number_of_part and not name_of_part:
+    elif not name_of_part and not is_series:
         titles["title"] = ". ".join([main_title, number_of_part])
 
     # CASE 3: Main title and number of part, but no name of part (for series)
-    if is_series and main_title and number_of_part and not name_of_part:
+    elif not name_of_part:
         titles["title"] = ". ".join([main_title, number_of_part])
         titles["series_title"] = main_title
         titles["episode_title"] = number_of_part
 
     # CASE 2: Main title and name of part, but no number of part
-    if main_title and name_of_part and not number_of_part:
+    elif not number_of_part:
         titles["title"] = ". ".join([main_title, name_of_part])
         titles["series_title"] = main_title
         titles["episode_title"] = name_of_part
 
     # CASE 1: Main title, name of part, and number of part
-    if main_title and name_of_part and number_of_part:
+    else:
         titles["title"] = ". ".join([main_title, name_of_part, number_of_part])
         titles["series_title"] = main_title
         titles["episode_title"] = ". ".join([name_of_part, number_of_part])
@@ -340,3 +616,123 @@ def get_bib_id(marc_record: Record) -> str:
 
 
 # endregion
+
+
+# region Full record
+class _IndexedRecord(Record):
+    """A read-only view of a pymarc Record, with its fields indexed by tag.
+
+    pymarc looks up fields by scanning the record's whole field list,
+    and `Record.get()` scans it twice. This view builds a tag index in a
+    single pass, so the lookups made while extracting metadata are dict hits.
+    The index is not updated if fields are added or removed later.
+    """
+
+    def __init__(self, bib_record: Record) -> None:
+        super().__init__(fields=bib_record.fields)
+        self.leader = bib_record.leader
+        self._fields_by_tag: dict[str, list] = {}
+        for field in bib_record.fields:
+            self._fields_by_tag.setdefault(field.tag, []).append(field)
+
+    def __contains__(self, tag: str) -> bool:
+        return tag in self._fields_by_tag
+
+    def get_fields(self, *args) -> list:
+        # Multiple tags must be returned in record order, so leave those to pymarc.
+        if len(args) != 1:
+            return super().get_fields(*args)
+        return list(self._fields_by_tag.get(args[0], []))
+
+
+def get_bib_metadata(
+    bib_record: Record,
+    model: Language,
+    is_series: bool = False,
+    creators: list | None = None,
+) -> dict:
+    """Extract all metadata needed from a MARC bib record.
+
+    Gives the same results as calling each of the `get_*()` functions
+    in this module separately, but the record's fields are indexed once
+    and shared by all of them.
+
+    :param bib_record: Pymarc Record object containing the bib data.
+    :param model: Spacy language model for NER.
+    :param is_series: Whether the record is a series, derived from Filemaker record.
+    Defaults to False.
+    :param creators: Creators already parsed from the record, e.g. by `get_creators_batch()`.
+    If not provided, creators are parsed from the record using `model`.
+    :return: A dict with the bib ID, language, creators, and all title and date info.
+    :raises ValueError: If no title statement (245 field) or main title (245$a) is found.
+    """
+    indexed_record = _IndexedRecord(bib_record)
+    if creators is None:
+        creators = get_creators(indexed_record, model)
+    return {
+        "alma_bib_id": get_bib_id(indexed_record),
+        "language": get_language_name(indexed_record),
+        "creators": creators,
+        **get_title_info(indexed_record, is_series),
+        **get_date_info(indexed_record),
+    }
+
+
+def _process_record_chunk(
+    records: Sequence[tuple[Record, bool]], model_name: str
+) -> list[dict]:
+    """Extract metadata from a chunk of MARC bib records, in a worker process.
+
+    :param records: Tuples of (bib record, is_series flag).
+    :param model_name: Name of the spacy model to use for NER,
+    loaded once per worker process.
+    :return: List of metadata dicts, as returned by `get_bib_metadata()`.
+    """
+    model = load_ner_model(model_name)
+    creators_by_record = get_creators_batch([record for record, _ in records], model)
+    return [
+        get_bib_metadata(record, model, is_series, creators)
+        for (record, is_series), creators in zip(records, creators_by_record)
+    ]
+
+
+def process_records(
+    bib_records: Iterable[Record],
+    is_series: Iterable[bool] | None = None,
+    model_name: str = "en_core_web_md",
+    max_workers: int | None = None,
+    chunk_size: int = 256,
+) -> list[dict]:
+    """Extract metadata from many MARC bib records, using multiple processes.
+
+    Records are split into chunks, which are processed in parallel by a pool of
+    worker processes. Each worker loads the spacy model once, and parses creators
+    for each chunk in a single NER batch.
+
+    :param bib_records: Pymarc Record objects containing the bib data.
+    :param is_series: Whether each record is a series, in the same order as `bib_records`.
+    Defaults to False for all records.
+    :param model_name: Name of the spacy model to use for NER. Defaults to en_core_web_md.
+    :param max_workers: Maximum number of worker processes. Defaults to the number of CPUs.
+    If 1, records are processed in the current process, without a pool.
+    :param chunk_size: Number of records sent to a worker at a time.
+    :return: List of metadata dicts, as returned by `get_bib_metadata()`,
+    in the same order as `bib_records`.
+    :raises ValueError: If a record has no title statement (245 field) or main title (245$a).
+    """
+    bib_records = list(bib_records)
+    series_flags = [False] * len(bib_records) if is_series is None else list(is_series)
+    records = list(zip(bib_records, series_flags, strict=True))
+    chunks = list(batched(records, chunk_size))
+
+    if max_workers == 1:
+        results = [_process_record_chunk(chunk, model_name) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(
+                executor.map(_process_record_chunk, chunks, [model_name] * len(chunks))
+            )
+    return [metadata for chunk_results in results for metadata in chunk_results]
+
+
+# endregion
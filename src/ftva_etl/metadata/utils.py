@@ -1,13 +1,37 @@
+import re
 import sys
 import dateutil.parser
 import string
 import logging
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
+from pymarc import Field, Record
 
 # Create a module logger, which will be a child of the package logger
 logger = logging.getLogger(__name__)
 
+# Characters removed by `strip_item_whitespace_and_punctuation()`.
+# Space is included in the right-strip to handle spaces after punctuation.
+_RSTRIP_CHARS = string.punctuation + " "
+_STRIP_CHARS = "[] "
+
+# Inventory numbers with these prefixes may match call numbers with these suffixes,
+# per FTVA guidelines; see `_is_inventory_number_match()`.
+_INV_NO_PREFIXES = ("DVD", "HFA", "VA", "VD", "XFE", "XFF", "XVE", "ZVB")
+_CALL_NO_SUFFIXES = frozenset((" M", " R", " T"))
+
+# Common full-precision date shapes which `parse_date()` can handle with `strptime`,
+# without using the much slower general parser in dateutil.
+_PRECISE_DATE_FORMATS = (
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "%Y-%m-%d"),  # e.g. "1996-10-05"
+    (re.compile(r"[A-Z][a-z]+ \d{1,2}, \d{4}"), "%B %d, %Y"),  # e.g. "October 5, 1996"
+    (
+        re.compile(r"[A-Z][a-z]{2}\. \d{1,2}, \d{4}"),
+        "%b. %d, %Y",
+    ),  # e.g. "Oct. 5, 1996"
+)
+
 
 def format_date(date_string: str, format: str = "%Y-%m-%d") -> str:
     """Format a date string to a given format.
@@ -24,6 +48,7 @@ def format_date(date_string: str, format: str = "%Y-%m-%d") -> str:
         raise ValueError(f"'{date_string}' cannot be parsed to a date")
 
 
+@lru_cache(maxsize=4096)
 def _is_imprecise_date(date_string: str) -> bool:
     """Return True if date_string lacks full year-month-day precision.
 
@@ -61,6 +86,23 @@ def _is_imprecise_date(date_string: str) -> bool:
     return False
 
 
+def _parse_precise_date(date_string: str) -> Optional[str]:
+    """Parse a date string in one of the common full-precision formats.
+
+    :param date_string: Date string to parse, without brackets or trailing punctuation.
+    :return: The date formatted as YYYY-MM-DD, or None if the date string is not in
+    one of `_PRECISE_DATE_FORMATS`, so must be handled by `parse_date()` in full.
+    """
+    for pattern, format in _PRECISE_DATE_FORMATS:
+        if pattern.fullmatch(date_string):
+            try:
+                return datetime.strptime(date_string, format).strftime("%Y-%m-%d")
+            except ValueError:
+                # E.g. an invalid day or unknown month name; let dateutil decide.
+                return None
+    return None
+
+
 def parse_date(date_string: str) -> str:
     """Parse a date string into a standardized format.
 
@@ -81,6 +123,11 @@ def parse_date(date_string: str) -> str:
     date_string = date_string.rstrip(".,;:!?")
     date_string = date_string.strip()
 
+    # Most dates are in a few common formats, which can be parsed quickly.
+    precise_date = _parse_precise_date(date_string)
+    if precise_date:
+        return f"[{precise_date}]" if in_brackets else precise_date
+
     # If the date string is imprecise (i.e. not year-month-day precision), keep it as-is
     if _is_imprecise_date(date_string):
         formatted_date = date_string
@@ -101,15 +148,25 @@ def parse_date(date_string: str) -> str:
     return formatted_date
 
 
+def strip_item_whitespace_and_punctuation(item: str) -> str:
+    """Strip whitespace and punctuation from a single string,
+    as `strip_whitespace_and_punctuation()` does for each string in a list.
+
+    :param item: The string to strip.
+    :return: The string with whitespace and punctuation stripped.
+    """
+    # Right-strip punctuation and spaces, then explicitly strip
+    # square brackets and spaces from resulting string.
+    return item.rstrip(_RSTRIP_CHARS).strip(_STRIP_CHARS)
+
+
 def strip_whitespace_and_punctuation(items: list[str]) -> list[str]:
     """A utility function for striping whitespace and punctuation from lists of strings.
 
     :param items: A list of strings to strip.
     :return: The list of strings with whitespace and punctuation stripped.
     """
-    # Add space to right-strip of punctuation to handle spaces after punctuation,
-    # then explicitly strip square brackets and spaces from resulting string.
-    return [item.rstrip(string.punctuation + " ").strip("[] ") for item in items]
+    return [strip_item_whitespace_and_punctuation(item) for item in items]
 
 
 def cleanup_production_type(production_type: str) -> list[str]:
@@ -120,10 +177,82 @@ def cleanup_production_type(production_type: str) -> list[str]:
     This function cleans up the string to allow series identification.
 
     :param production_type: A string containing the production types.
-    :return: A list representation of the production types.
+    :return: A list representation of the production types, without empty items.
+    """
+    # Split by carriage returns, then strip each item's whitespace and normalize
+    # to lowercase, skipping empty items (e.g. from a trailing carriage return).
+    return [
+        stripped.lower()
+        for item in production_type.split("\r")
+        if (stripped := item.strip())
+    ]
+
+
+def _first_subfield(field: Field, code: str) -> Optional[str]:
+    """Get the value of the first subfield with the given code, without building
+    a list of all of them as `Field.get_subfields()` does.
+
+    :param field: A pymarc Field.
+    :param code: The subfield code to find.
+    :return: The value of the first matching subfield, or None if there is none.
     """
-    # Normalize to lowercase, split by carriage returns, then strip each item's whitespace
-    return [item.strip() for item in production_type.lower().split("\r")]
+    for subfield in field.subfields:
+        if subfield.code == code:
+            return subfield.value
+    return None
+
+
+def index_ava(records: list) -> list[tuple[str, str, Record]]:
+    """Given a list of pymarc Records from Alma as obtained via SRU, return a flat index
+    of their holdings, for matching many inventory numbers against the same records.
+
+    :param records: A list of pymarc Records from Alma.
+    :return: A list of (lowercased library code, call number, record) tuples,
+    one for each FTVA AVA field with a call number.
+    """
+    # Holdings information is in the "availability" fields (tag AVA),
+    # found within the MARC bib record provided by the SRU client.
+    # There may be multiple AVA fields (one for each holding record), so get them all.
+    ava_index = []
+    for record in records:
+        for field_ava in record.get_fields("AVA"):
+            # $b is the library code, which should be "ftva" for FTVA records;
+            # $d is Call Number. There should only be one of each,
+            # so just use the first one of each.
+            library_code = _first_subfield(field_ava, "b")
+            # Only FTVA holdings can match, so don't index other libraries.
+            if library_code is None or library_code.lower() != "ftva":
+                continue
+            call_number = _first_subfield(field_ava, "d")
+            if call_number is not None:
+                ava_index.append(("ftva", call_number, record))
+    return ava_index
+
+
+def filter_by_inventory_number_and_library_indexed(
+    ava_index: list[tuple[str, str, Record]], inventory_number: str
+) -> list:
+    """Given an index of holdings built by `index_ava()`, and an inventory number
+    (sourced from FTVA database), return a list of pymarc Records which match the inventory number
+    and are from the FTVA library.
+
+    :param ava_index: A list of (library code, call number, record) tuples from `index_ava()`.
+    :param inventory_number: The inventory number to match.
+    :return: A list of pymarc Records from the FTVA library with matching
+    inventory number, each included once, in index order.
+    """
+    filtered_records = []
+    # A record may have several matching AVA fields, but should only be returned once.
+    seen_record_ids = set()
+    for library_code, call_number, record in ava_index:
+        if (
+            library_code == "ftva"
+            and id(record) not in seen_record_ids
+            and _is_inventory_number_match(inventory_number, call_number)
+        ):
+            seen_record_ids.add(id(record))
+            filtered_records.append(record)
+    return filtered_records
 
 
 def filter_by_inventory_number_and_library(
@@ -133,33 +262,17 @@ def filter_by_inventory_number_and_library(
     (sourced from FTVA database), return a list of pymarc Records which match the inventory number
     and are from the FTVA library.
 
+    To match several inventory numbers against the same records, build the index once
+    with `index_ava()` and use `filter_by_inventory_number_and_library_indexed()`.
+
     :param records: A list of pymarc Records from Alma.
     :param inventory_number: The inventory number to match.
     :return: A list of pymarc Records from the FTVA library with matching
     inventory number.
     """
-
-    filtered_records = []
-    for record in records:
-        # Holdings information is in the "availability" fields (tag AVA),
-        # found within the MARC bib record provided by the SRU client.
-        # There may be multiple AVA fields (one for each holding record), so get them all.
-        fields_ava = record.get_fields("AVA")
-        for field_ava in fields_ava:
-            # $b is the library code, which should be "ftva" for FTVA records.
-            # get_subfields() returns a list, but there should only be one $b and $d,
-            # so just check the first one of each.
-            library_code = field_ava.get_subfields("b")[0].lower()
-            # $d is Call Number.
-            call_number = field_ava.get_subfields("d")[0]
-
-            if library_code == "ftva" and _is_inventory_number_match(
-                inventory_number, call_number
-            ):
-                filtered_records.append(record)
-                break  # No need to check other AVA fields for this record.
-
-    return filtered_records
+    return filter_by_inventory_number_and_library_indexed(
+        index_ava(records), inventory_number
+    )
 
 
 def _is_inventory_number_match(inventory_number: str, call_number: str) -> bool:
@@ -172,22 +285,19 @@ def _is_inventory_number_match(inventory_number: str, call_number: str) -> bool:
     :return: True if the inventory number matches the call number, False otherwise.
     """
 
-    inv_no_prefixes = ["DVD", "HFA", "VA", "VD", "XFE", "XFF", "XVE", "ZVB"]
-    call_no_suffixes = [" M", " R", " T"]
-
     # Exact match is always a match.
     if inventory_number == call_number:
         return True
 
     # If inventory number starts with a known prefix, check if it matches call number
     # with any added suffixes.
-    for prefix in inv_no_prefixes:
-        if inventory_number.startswith(prefix):
-            for suffix in call_no_suffixes:
-                if inventory_number + suffix == call_number:
-                    return True
-
-    return False
+    if not inventory_number.startswith(_INV_NO_PREFIXES):
+        return False
+    prefix_length = len(inventory_number)
+    return (
+        call_number[:prefix_length] == inventory_number
+        and call_number[prefix_length:] in _CALL_NO_SUFFIXES
+    )
 
 
 def _reset_handlers(logger: logging.Logger) -> None:
@@ -0,0 +1,167 @@
+from io import BytesIO
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs, urlsplit
+from requests import ConnectionError, Request
+from pymarc import parse_xml_to_array
+from src.ftva_etl.clients.alma_sru_client import AlmaSRUClient
+
+# Minimal SRU response containing two MARCXML records,
+# trimmed from a real Alma SRU search.
+SRU_RESPONSE = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<searchRetrieveResponse xmlns="http://www.loc.gov/zing/srw/">
+  <version>1.2</version>
+  <numberOfRecords>2</numberOfRecords>
+  <records>
+    <record>
+      <recordSchema>marcxml</recordSchema>
+      <recordPacking>xml</recordPacking>
+      <recordData>
+        <record xmlns="http://www.loc.gov/MARC21/slim">
+          <leader>01234cgm a2200313Ii 4500</leader>
+          <controlfield tag="001">9912345678906533</controlfield>
+          <controlfield tag="008">230101s2023    cau075            vleng d</controlfield>
+          <datafield tag="245" ind1="0" ind2="0">
+            <subfield code="a">Main Title /</subfield>
+            <subfield code="c">directed by Jane Director.</subfield>
+          </datafield>
+          <datafield tag="AVA" ind1=" " ind2=" ">
+            <subfield code="b">FTVA</subfield>
+            <subfield code="d">M12345</subfield>
+          </datafield>
+        </record>
+      </recordData>
+      <recordPosition>1</recordPosition>
+    </record>
+    <record>
+      <recordSchema>marcxml</recordSchema>
+      <recordPacking>xml</recordPacking>
+      <recordData>
+        <record xmlns="http://www.loc.gov/MARC21/slim">
+          <leader>01234cgm a2200313Ii 4500</leader>
+          <controlfield tag="001">9987654321906533</controlfield>
+          <datafield tag="245" ind1="1" ind2="4">
+            <subfield code="a">The Second Title</subfield>
+            <subfield code="n">Episode 2</subfield>
+          </datafield>
+        </record>
+      </recordData>
+      <recordPosition>2</recordPosition>
+    </record>
+  </records>
+</searchRetrieveResponse>
+"""
+
+EMPTY_SRU_RESPONSE = """<?xml version="1.0" encoding="UTF-8" standalone="no"?>
+<searchRetrieveResponse xmlns="http://www.loc.gov/zing/srw/">
+  <version>1.2</version>
+  <numberOfRecords>0</numberOfRecords>
+</searchRetrieveResponse>
+"""
+
+
+class TestAlmaSRUClient(TestCase):
+    def setUp(self):
+        self.client = AlmaSRUClient()
+
+    def test_convert_sru_xml_to_marc_records(self):
+        records = list(
+            self.client._convert_sru_xml_to_marc_records(SRU_RESPONSE.encode())
+        )
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0]["001"].value(), "9912345678906533")
+        self.assertEqual(records[1]["245"].get_subfields("n"), ["Episode 2"])
+
+    def test_convert_with_nodes_before_root(self):
+        # Comments and processing instructions before the root element are valid XML.
+        sru_response = SRU_RESPONSE.replace(
+            "?>\n", "?>\n<!-- generated -->\n<?generator alma?>\n", 1
+        )
+        self.assertIn("<!-- generated -->", sru_response)
+        records = list(
+            self.client._convert_sru_xml_to_marc_records(sru_response.encode())
+        )
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1]["001"].value(), "9987654321906533")
+
+    def test_convert_matches_pymarc_marcxml_parsing(self):
+        # Records built from the SRU response should be identical to those
+        # pymarc builds from the same MARCXML.
+        records = list(
+            self.client._convert_sru_xml_to_marc_records(SRU_RESPONSE.encode())
+        )
+        start = SRU_RESPONSE.index('<record xmlns="http://www.loc.gov/MARC21/slim">')
+        end = SRU_RESPONSE.index("</record>", start) + len("</record>")
+        with BytesIO(SRU_RESPONSE[start:end].encode()) as fh:
+            expected = parse_xml_to_array(fh)[0]
+        self.assertEqual(records[0].as_marc(), expected.as_marc())
+        self.assertEqual(records[0]["245"].indicators, expected["245"].indicators)
+
+    def test_get_fields(self):
+        records = list(
+            self.client._convert_sru_xml_to_marc_records(SRU_RESPONSE.encode())
+        )
+        fields = self.client.get_fields(records[0], ["245", "001"])
+        # Fields are returned in record order, not tag list order.
+        self.assertEqual([field.tag for field in fields], ["001", "245"])
+        self.assertEqual(self.client.get_fields(records[0], ["500"]), [])
+
+    def test_search_url_matches_encoded_parameters(self):
+        response = MagicMock()
+        response.content = SRU_RESPONSE.encode()
+        with patch.object(
+            self.client._session, "get", return_value=response
+        ) as mock_get:
+            records = self.client.search_by_call_number("M1234 T")
+        self.assertEqual(len(records), 2)
+        # The pre-encoded URL should be the same as the one requests
+        # would build from the full set of parameters.
+        expected_url = (
+            Request(
+                "GET",
+                self.client._SRU_URL,
+                params={
+                    **self.client._SRU_DEFAULT_PARAMETERS,
+                    "query": 'alma.PermanentCallNumber="M1234 T"',
+                },
+            )
+            .prepare()
+            .url
+        )
+        requested_url = Request("GET", mock_get.call_args.kwargs["url"]).prepare().url
+        self.assertEqual(requested_url, expected_url)
+
+
+class TestAlmaSRUClientBatch(TestCase):
+    def setUp(self):
+        # Disable the TTL cache, so only de-duplication prevents repeated searches.
+        self.client = AlmaSRUClient(cache_ttl=0)
+
+    def _get(self, url: str, **kwargs) -> MagicMock:
+        """Mock `Session.get()`: "M12345" finds both test records, "BAD" fails,
+        and any other call number finds nothing."""
+        query = parse_qs(urlsplit(url).query)["query"][0]
+        if "BAD" in query:
+            raise ConnectionError("Alma is unavailable")
+        response = MagicMock()
+        if "M12345" in query:
+            response.content = SRU_RESPONSE.encode()
+        else:
+            response.content = EMPTY_SRU_RESPONSE.encode()
+        return response
+
+    def test_results_are_keyed_in_requested_order(self):
+        with patch.object(
+            self.client._session, "get", side_effect=self._get
+        ) as mock_get:
+            results = self.client.search_by_call_numbers(["M99999", "M12345", "M99999"])
+        self.assertEqual(list(results), ["M99999", "M12345"])
+        self.assertEqual(results["M99999"], [])
+        self.assertEqual(len(results["M12345"]), 2)
+        # Repeated call numbers are only searched once.
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_error_in_one_search_is_raised(self):
+        with patch.object(self.client._session, "get", side_effect=self._get):
+            with self.assertRaises(ConnectionError):
+                self.client.search_by_call_numbers(["M12345", "BAD", "M99999"])
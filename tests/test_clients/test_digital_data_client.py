@@ -0,0 +1,141 @@
+import orjson
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+from cachetools import LRUCache
+from requests import HTTPError
+from src.ftva_etl.clients.digital_data_client import DigitalDataClient
+
+
+def _get_mock_response(
+    data: dict, status_code: int = 200, headers: dict | None = None
+) -> MagicMock:
+    """Create a mock response, as returned by an API request.
+
+    :param data: The record data the response should contain.
+    :param status_code: The HTTP status code of the response.
+    :param headers: The HTTP headers of the response.
+    :return: A mock of a `requests.Response`.
+    """
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.content = orjson.dumps(data)
+    return response
+
+
+class TestDigitalDataClientCache(TestCase):
+    def setUp(self):
+        self.client = DigitalDataClient(user="user", password="password")
+        self.record = {"id": 1, "file_name": "file.mov"}
+
+    def test_repeated_id_is_fetched_once(self):
+        with patch.object(
+            self.client._session, "get", return_value=_get_mock_response(self.record)
+        ) as mock_get:
+            self.assertEqual(self.client.get_record_by_id(1), self.record)
+            self.assertEqual(self.client.get_record_by_id(1), self.record)
+            self.assertEqual(mock_get.call_count, 1)
+
+    def test_invalidate_forces_refetch(self):
+        with patch.object(
+            self.client._session, "get", return_value=_get_mock_response(self.record)
+        ) as mock_get:
+            self.client.get_record_by_id(1)
+            self.client.invalidate(1)
+            self.client.get_record_by_id(1)
+            self.assertEqual(mock_get.call_count, 2)
+
+
+class TestDigitalDataClientConditionalRequests(TestCase):
+    def setUp(self):
+        # Disable the TTL cache, so every lookup reaches the (mock) API.
+        self.client = DigitalDataClient(user="user", password="password", cache_ttl=0)
+        self.record = {"id": 1, "file_name": "file.mov"}
+
+    def test_unchanged_record_uses_etag(self):
+        responses = [
+            _get_mock_response(self.record, headers={"ETag": '"abc"'}),
+            _get_mock_response({}, status_code=304),
+        ]
+        with patch.object(
+            self.client._session, "get", side_effect=responses
+        ) as mock_get:
+            self.assertEqual(self.client.get_record_by_id(1), self.record)
+            # Second request sends the ETag, and gets the record from the first response.
+            self.assertEqual(self.client.get_record_by_id(1), self.record)
+            second_call_headers = mock_get.call_args_list[1].kwargs["headers"]
+            self.assertEqual(second_call_headers, {"If-None-Match": '"abc"'})
+
+    def test_changed_record_replaces_cached_copy(self):
+        changed_record = {"id": 1, "file_name": "new_file.mov"}
+        responses = [
+            _get_mock_response(self.record, headers={"ETag": '"abc"'}),
+            _get_mock_response(changed_record, headers={"ETag": '"def"'}),
+        ]
+        with patch.object(self.client._session, "get", side_effect=responses):
+            self.client.get_record_by_id(1)
+            self.assertEqual(self.client.get_record_by_id(1), changed_record)
+
+    def test_unexpected_not_modified_raises(self):
+        # A 304 for a record never fetched before has no cached copy to return.
+        with patch.object(
+            self.client._session,
+            "get",
+            return_value=_get_mock_response({}, status_code=304),
+        ):
+            with self.assertRaises(HTTPError):
+                self.client.get_record_by_id(1)
+
+    def test_default_etag_cache_is_bounded(self):
+        client = DigitalDataClient(user="user", password="password", cache_maxsize=2)
+        self.assertIsInstance(client._etag_cache, LRUCache)
+        self.assertEqual(client._etag_cache.maxsize, 2)
+
+
+class TestDigitalDataClientResponses(TestCase):
+    def setUp(self):
+        self.client = DigitalDataClient(user="user", password="password")
+
+    def test_no_content_returns_empty_dict(self):
+        with patch.object(
+            self.client._session,
+            "get",
+            return_value=_get_mock_response({}, status_code=204),
+        ):
+            self.assertEqual(self.client.get_record_by_id(1), {})
+
+    def test_other_success_status_returns_record(self):
+        record = {"id": 1, "file_name": "file.mov"}
+        with patch.object(
+            self.client._session,
+            "get",
+            return_value=_get_mock_response(record, status_code=203),
+        ):
+            self.assertEqual(self.client.get_record_by_id(1), record)
+
+
+class TestDigitalDataClientBatch(TestCase):
+    def setUp(self):
+        # Disable the TTL cache, so only de-duplication prevents repeated requests.
+        self.client = DigitalDataClient(user="user", password="password", cache_ttl=0)
+
+    def _get(self, url: str, **kwargs) -> MagicMock:
+        """Mock `Session.get()`, returning a record with the id from the URL."""
+        record_id = int(url.rsplit("/", 1)[1])
+        if record_id < 0:
+            raise ConnectionError(f"Failed to fetch record {record_id}")
+        return _get_mock_response({"id": record_id})
+
+    def test_records_are_returned_in_requested_order(self):
+        with patch.object(
+            self.client._session, "get", side_effect=self._get
+        ) as mock_get:
+            records = self.client.get_records_by_ids([3, 1, 2, 1, 3])
+        self.assertEqual([record["id"] for record in records], [3, 1, 2, 1, 3])
+        # Repeated ids are only fetched once.
+        self.assertEqual(mock_get.call_count, 3)
+
+    def test_error_in_one_request_is_raised(self):
+        with patch.object(self.client._session, "get", side_effect=self._get):
+            with self.assertRaises(ConnectionError):
+                self.client.get_records_by_ids([1, -1, 2])
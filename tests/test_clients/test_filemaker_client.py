@@ -0,0 +1,93 @@
+from unittest import TestCase
+from unittest.mock import patch
+from fmrest.exceptions import FileMakerError
+from fmrest.record import Record
+from src.ftva_etl.clients.filemaker_client import (
+    FilemakerClient,
+    _DEFAULT_FIELDS,
+    logger as fm_client_logger,
+)
+
+
+class TestFilemakerClientBatchSearch(TestCase):
+    def setUp(self):
+        # Don't create or log in to a real Filemaker server.
+        with patch("fmrest.Server"):
+            self.client = FilemakerClient(user="user", password="password")
+
+    def _find(self, query: list[dict], **kwargs) -> list[Record]:
+        """Mock `fmrest.Server.find()`, matching records by exact inventory number."""
+        inventory_numbers = [criterion["inventory_no"][2:] for criterion in query]
+        records = [
+            Record(["inventory_no", "title"], [inventory_number, "Title"])
+            for inventory_number in inventory_numbers
+            if inventory_number != "missing"
+        ]
+        if not records:
+            raise FileMakerError("Filemaker Data API error 401: No records match")
+        return records
+
+    def test_results_are_keyed_in_requested_order(self):
+        self.client._fms.find.side_effect = self._find
+        results = self.client.search_by_inventory_numbers(["M2", "missing", "M1", "M2"])
+        self.assertEqual(list(results), ["M2", "missing", "M1"])
+        self.assertEqual(results["M1"][0]["inventory_no"], "M1")
+        self.assertEqual(len(results["M2"]), 1)
+        self.assertEqual(results["missing"], [])
+
+    def test_inventory_numbers_are_chunked(self):
+        self.client._fms.find.side_effect = self._find
+        inventory_numbers = [f"M{number}" for number in range(5)]
+        results = self.client.search_by_inventory_numbers(
+            inventory_numbers, chunk_size=2
+        )
+        # 5 inventory numbers in chunks of 2 means 3 find requests.
+        self.assertEqual(self.client._fms.find.call_count, 3)
+        self.assertTrue(all(len(records) == 1 for records in results.values()))
+
+    def test_records_match_despite_case_and_whitespace(self):
+        # Filemaker's exact match ignores case, so records may not match exactly.
+        self.client._fms.find.return_value = [
+            Record(["inventory_no", "title"], [" m1 ", "Title"]),
+            Record(["inventory_no", "title"], ["M3", "Unrequested"]),
+        ]
+        with self.assertLogs(fm_client_logger, level="WARNING") as log_context:
+            results = self.client.search_by_inventory_numbers(["M1", "M2"])
+        self.assertEqual(results["M1"][0]["inventory_no"], " m1 ")
+        self.assertEqual(results["M2"], [])
+        # Records which don't match any requested number are logged, not dropped silently.
+        self.assertEqual(len(log_context.output), 1)
+        self.assertIn("'M3'", log_context.output[0])
+
+    def test_requests_differing_only_by_case_all_get_records(self):
+        self.client._fms.find.return_value = [
+            Record(["inventory_no", "title"], ["M1", "Title"]),
+        ]
+        results = self.client.search_by_inventory_numbers(["m1", "M1"])
+        self.assertEqual(list(results), ["m1", "M1"])
+        self.assertEqual(len(results["m1"]), 1)
+        self.assertEqual(len(results["M1"]), 1)
+        # Both requests share one find criterion.
+        self.client._fms.find.assert_called_once()
+        self.assertEqual(len(self.client._fms.find.call_args.args[0]), 1)
+
+
+class TestFilemakerClientGetFields(TestCase):
+    def setUp(self):
+        with patch("fmrest.Server"):
+            self.client = FilemakerClient(user="user", password="password")
+
+    def test_default_fields(self):
+        values = [f"value {number}" for number in range(len(_DEFAULT_FIELDS))]
+        fm_record = Record([*_DEFAULT_FIELDS, "other"], [*values, "other value"])
+        fields = self.client.get_fields(fm_record)
+        self.assertEqual(fields, dict(zip(_DEFAULT_FIELDS, values)))
+
+    def test_default_fields_missing_from_record_are_skipped(self):
+        fm_record = Record(["title", "other"], ["Title", "other value"])
+        self.assertEqual(self.client.get_fields(fm_record), {"title": "Title"})
+
+    def test_specific_fields(self):
+        fm_record = Record(["title", "other"], ["Title", "other value"])
+        fields = self.client.get_fields(fm_record, ["other", "missing"])
+        self.assertEqual(fields, {"other": "other value"})
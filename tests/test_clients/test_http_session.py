@@ -0,0 +1,23 @@
+from unittest import TestCase
+from src.ftva_etl.clients.http_session import create_session
+
+
+class TestCreateSession(TestCase):
+    def test_retry_and_pool_policy(self):
+        session = create_session(auth=("user", "password"), pool_maxsize=8)
+        self.assertEqual(session.auth, ("user", "password"))
+        for prefix in ("https://", "http://"):
+            with self.subTest(prefix=prefix):
+                adapter = session.get_adapter(f"{prefix}example.com")
+                retries = adapter.max_retries
+                self.assertEqual(retries.total, 5)
+                self.assertEqual(retries.backoff_factor, 0.5)
+                # Rate limiting and transient server errors are retried.
+                self.assertTrue(
+                    {429, 500, 502, 503, 504}.issubset(retries.status_forcelist)
+                )
+                # Only idempotent GET requests are retried.
+                self.assertEqual(retries.allowed_methods, ["GET"])
+                self.assertFalse(retries.raise_on_status)
+                # The pool size is passed on to each host's connection pool.
+                self.assertEqual(adapter.poolmanager.connection_pool_kw["maxsize"], 8)
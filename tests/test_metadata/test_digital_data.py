@@ -1,5 +1,6 @@
 from unittest import TestCase
 from src.ftva_etl.metadata.digital_data import (
+    DigitalDataView,
     get_dcp_info,
     get_dpx_info,
     get_record_type_and_match_asset,
@@ -112,3 +113,25 @@ class TestDigitalData(TestCase):
             with self.subTest(dd_record=dd_record, expected_result=expected_result):
                 result = get_record_type_and_match_asset(dd_record)
                 self.assertEqual(result, expected_result)
+
+    def test_digital_data_view(self):
+        dd_record = {
+            "id": 42,
+            "uuid": "12345",
+            "file_name": "file name",
+            "file_folder_name": "folder name",
+            "media_type": "Video",
+        }
+        view = DigitalDataView.from_record(dd_record)
+        self.assertEqual(view.record_id, 42)
+        self.assertEqual(view.uuid, "12345")
+        self.assertEqual(view.file_name, "file name")
+        # Note that the view renames some field names, which is intentional.
+        self.assertEqual(view.folder_name, "folder name")
+        self.assertEqual(view.media_type, "Video")
+        # Missing fields get the same defaults as the getter functions.
+        self.assertEqual(view.sub_folder_name, "")
+        self.assertEqual(view.asset_type, "")
+        self.assertEqual(view.audio_class, "")
+        # Non-DCP/DPX records have no file type fields.
+        self.assertEqual(view.get_file_type_info(), {})
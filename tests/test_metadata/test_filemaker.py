@@ -14,7 +14,8 @@ from fmrest.record import Record
 
 
 class TestFilemaker(TestCase):
-    def test_is_series_production_type(self):
+    @classmethod
+    def setUpClass(cls):
         # Cherry-picked data from Filemaker PD that should be identified as series
         valid_test_cases = [
             "NEWS\rCOMPILATION",
@@ -29,7 +30,7 @@ class TestFilemaker(TestCase):
             "FOO\rBAR\rBAZ",
             "TELEVISION\rMINIATURE",
         ]
-        self.valid_test_records = [
+        cls.valid_test_records = [
             # recordId and modId are added
             # for use in __repr__ method on Record class
             Record(
@@ -38,7 +39,7 @@ class TestFilemaker(TestCase):
             )
             for index, value in enumerate(valid_test_cases)
         ]
-        self.invalid_test_records = [
+        cls.invalid_test_records = [
             Record(
                 keys=["recordId", "modId", "production_type"],
                 values=[index, 0, value],
@@ -46,6 +47,7 @@ class TestFilemaker(TestCase):
             for index, value in enumerate(invalid_test_cases)
         ]
 
+    def test_is_series_production_type(self):
         for record in self.valid_test_records:
             with self.subTest(record=record):
                 self.assertTrue(is_series_production_type(record))
@@ -56,7 +58,8 @@ class TestFilemaker(TestCase):
 
 
 class TestFilemakerDateInfo(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Test cases are tuples, where 1st elem is input date info,
         # and 2nd elem is expected result from get_date_info()
         test_cases = [
@@ -114,7 +117,7 @@ class TestFilemakerDateInfo(TestCase):
         ]
 
         # Transform test cases into tuples of FM record and expected results
-        self.test_records = [
+        cls.test_records = [
             (
                 Record(
                     keys=["recordId", "modId", "release_broadcast_year", "record_date"],
@@ -139,7 +142,8 @@ class TestFilemakerDateInfo(TestCase):
 
 class TestFilemakerTitleInfo(TestCase):
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Test cases are tuples, where 1st elem is input title info,
         # and 2nd elem is expected result from get_title_info().
 
@@ -229,7 +233,7 @@ class TestFilemakerTitleInfo(TestCase):
                 },
             ),
         ]
-        self.test_records = [
+        cls.test_records = [
             Record(
                 keys=[
                     "recordId",
@@ -252,7 +256,7 @@ class TestFilemakerTitleInfo(TestCase):
             )
             for index, test_case in enumerate(test_cases)
         ]
-        self.expected_results = [test_case[1] for test_case in test_cases]
+        cls.expected_results = [test_case[1] for test_case in test_cases]
 
     def test_get_title_info(self):
         """Test that `get_title_info` correctly extracts title info from FM records."""
@@ -265,7 +269,8 @@ class TestFilemakerTitleInfo(TestCase):
 
 
 class TestFilemakerFilePathInfo(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         # Test cases are tuples, where 1st elem is input file path info,
         # and 2nd elem is expected result from get_file_path_info().
         test_cases = [
@@ -321,7 +326,7 @@ class TestFilemakerFilePathInfo(TestCase):
                 },
             ),  # Lowercase DCP test case
         ]
-        self.test_records = [
+        cls.test_records = [
             Record(
                 keys=["recordId", "modId", "file_path", "specific_carrier_type"],
                 values=[
@@ -333,7 +338,7 @@ class TestFilemakerFilePathInfo(TestCase):
             )
             for index, test_case in enumerate(test_cases)
         ]
-        self.expected_results = [test_case[1] for test_case in test_cases]
+        cls.expected_results = [test_case[1] for test_case in test_cases]
 
     def test_get_file_path_info(self):
         """Test that `get_file_path_info` correctly extracts file path info from FM records."""
@@ -363,7 +368,8 @@ class TestFilemakerFilePathInfo(TestCase):
 
 
 class TestFilemakerCreators(TestCase):
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         test_cases = [
             # Comma-separated values are split and stripped
             (
@@ -380,7 +386,7 @@ class TestFilemakerCreators(TestCase):
                 ["Ford Beebe & Cliff Smith"],
             ),
         ]
-        self.test_records = [
+        cls.test_records = [
             (
                 Record(
                     keys=["recordId", "modId", "director"],
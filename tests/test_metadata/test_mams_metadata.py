@@ -0,0 +1,121 @@
+import spacy
+from unittest import TestCase
+from fmrest.record import Record as FM_Record
+from pymarc import Field, Indicators, Record, Subfield
+from src.ftva_etl.metadata.marc import clear_creators_cache
+from src.ftva_etl.metadata.mams_metadata import (
+    get_mams_metadata,
+    get_mams_metadata_batch,
+)
+
+
+def _get_digital_data_record(index: int) -> dict:
+    return {"id": index, "uuid": f"uuid-{index}", "file_name": f"file_{index}.mov"}
+
+
+def _get_filemaker_record(index: int) -> FM_Record:
+    return FM_Record(
+        keys=[
+            "recordId",
+            "modId",
+            "inventory_id",
+            "inventory_no",
+            "director",
+            "Language",
+            "production_type",
+            "title",
+            "episode_title",
+            "episode no.",
+            "release_broadcast_year",
+            "record_date",
+        ],
+        values=[
+            index,
+            0,
+            index,
+            f"M{index}",
+            "FM Director",
+            "English",
+            "FEATURE",
+            f"FM Title {index}",
+            "",
+            "",
+            "1999",
+            "",
+        ],
+    )
+
+
+def _get_bib_record(title: str, creators: str) -> Record:
+    record = Record()
+    record.add_field(Field(tag="001", data="12345"))
+    record.add_field(
+        Field(
+            tag="245",
+            indicators=Indicators("0", "0"),
+            subfields=[
+                Subfield(code="a", value=title),
+                Subfield(code="c", value=creators),
+            ],
+        )
+    )
+    return record
+
+
+class TestMamsMetadataBatch(TestCase):
+    """Test formatting metadata for many records at once."""
+
+    def setUp(self):
+        # A blank pipeline with a rule-based entity recognizer is enough here,
+        # and much faster to load than a trained model.
+        self.nlp_model = spacy.blank("en")
+        ruler = self.nlp_model.add_pipe("entity_ruler")
+        ruler.add_patterns(
+            [
+                {"label": "PERSON", "pattern": "John Director"},
+                {"label": "PERSON", "pattern": "Jane Director"},
+            ]
+        )
+        clear_creators_cache()
+        # The middle record has no bib record, so its creators come from Filemaker.
+        bib_records = [
+            _get_bib_record("Alma Title 0", "director, John Director."),
+            None,
+            _get_bib_record("Alma Title 2", "director, Jane Director."),
+        ]
+        self.records = [
+            (_get_digital_data_record(index), _get_filemaker_record(index), bib_record)
+            for index, bib_record in enumerate(bib_records)
+        ]
+
+    def tearDown(self):
+        clear_creators_cache()
+
+    def test_batch_matches_single_records(self):
+        batch_results = get_mams_metadata_batch(self.records, self.nlp_model)
+        single_results = [
+            get_mams_metadata(*record, nlp_model=self.nlp_model)
+            for record in self.records
+        ]
+        self.assertEqual(batch_results, single_results)
+        # Results are in the same order as the input records.
+        self.assertEqual(
+            [metadata["uuid"] for metadata in batch_results],
+            ["uuid-0", "uuid-1", "uuid-2"],
+        )
+        self.assertEqual(
+            [metadata["creators"] for metadata in batch_results],
+            [["John Director"], ["FM Director"], ["Jane Director"]],
+        )
+        self.assertNotIn("alma_bib_id", batch_results[1])
+
+    def test_invalid_record_aborts_batch(self):
+        # A bib record with no 245 field is invalid.
+        invalid_bib_record = Record()
+        invalid_bib_record.add_field(Field(tag="001", data="67890"))
+        records = [
+            *self.records,
+            (_get_digital_data_record(3), _get_filemaker_record(3), invalid_bib_record),
+        ]
+        with self.assertRaises(ValueError):
+            get_mams_metadata_batch(records, self.nlp_model)
@@ -1,25 +1,41 @@
 import spacy
-from unittest import TestCase
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
 from src.ftva_etl.metadata.marc import (
+    _find_names,
+    _get_creator_string,
+    clear_creators_cache,
+    get_bib_metadata,
     get_creators,
+    get_creators_batch,
     get_date_info,
     get_language_name,
+    get_record_id,
     get_title_info,
+    load_ner_model,
+    process_records,
 )
 from pymarc import Record, Field, Indicators, Subfield
 
+# Indicators shared by many test fields; Indicators is an immutable namedtuple.
+_BLANK_INDICATORS = Indicators(" ", " ")
+_TITLE_INDICATORS = Indicators("0", "0")
+
 
 def _get_minimal_bib_record() -> Record:
     """Create a valid but minimal bib record with just 001 and 245 $a.
     This will be used as the base record, then copied & modified
     for other tests as needed.
 
+    Building the record directly is faster than copying a prototype record
+    with `copy.deepcopy()`, or reading one from MARC21 bytes with `MARCReader`.
+
     :return record: Minimal bib record with just 001 and 245 fields.
     """
     field_001 = Field(tag="001", data="12345")
     field_245 = Field(
         tag="245",
-        indicators=Indicators("0", "0"),
+        indicators=_TITLE_INDICATORS,
         subfields=[Subfield(code="a", value="F245a")],
     )
     record = Record()
@@ -106,146 +122,99 @@ class TestMarcTitlesRegion(TestCase):
     """Test the titles region of the MARC metadata module."""
 
     def setUp(self):
+        self.minimal_bib_record = self._get_record_without_245()
+
+    def _get_record_without_245(self) -> Record:
         minimal_bib_record = _get_minimal_bib_record()
         # Remove the 245 field, so it can be explicitly added in each test.
         field_245 = minimal_bib_record.get("245")
         minimal_bib_record.remove_field(field_245)
-        self.minimal_bib_record = minimal_bib_record
-
-    def test_spec_case_1(self):
-        """Test the spec case where the main title, name of part, and number of part are present."""
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
-                    Subfield(code="p", value="Name of Part"),
-                    Subfield(code="n", value="Number of Part"),
-                ],
-            )
-        )
-        titles = get_title_info(record)
-        expected_result = {
-            "title": "Main Title. Name of Part. Number of Part",
-            "series_title": "Main Title",
-            "episode_title": "Name of Part. Number of Part",
-        }
-        self.assertDictEqual(titles, expected_result)
-
-    def test_spec_case_1_with_remainder_of_title(self):
-        """Test the spec case where the main title, remainder of title,
-        name of part, and number of part are present. This should be sufficient
-        to cover the other cases as well, since this case includes all relevant title fields.
-        """
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
-                    Subfield(code="b", value="Remainder of Title"),
-                    Subfield(code="p", value="Name of Part"),
-                    Subfield(code="n", value="Number of Part"),
-                ],
-            )
-        )
-        titles = get_title_info(record)
-        expected_result = {
-            "title": "Main Title. Remainder of Title. Name of Part. Number of Part",
-            "series_title": "Main Title. Remainder of Title",
-            "episode_title": "Name of Part. Number of Part",
-        }
-        self.assertDictEqual(titles, expected_result)
-
-    def test_spec_case_2(self):
-        """Test the spec case where the main title and name of part are present,
-        but the number of part is not.
-        """
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
-                    Subfield(code="p", value="Name of Part"),
-                ],
-            )
-        )
-        titles = get_title_info(record)
-        expected_result = {
-            "title": "Main Title. Name of Part",
-            "series_title": "Main Title",
-            "episode_title": "Name of Part",
-        }
-        self.assertDictEqual(titles, expected_result)
-
-    def test_spec_case_3(self):
-        """Test the spec case where the main title and number of part are present,
-        but the name of part is not, and Filemaker indicates that the record is a series.
-        """
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
-                    Subfield(code="n", value="Number of Part"),
-                ],
-            )
-        )
-        titles = get_title_info(record, is_series=True)
-        expected_result = {
-            "title": "Main Title. Number of Part",
-            "series_title": "Main Title",
-            "episode_title": "Number of Part",
-        }
-        self.assertDictEqual(titles, expected_result)
+        return minimal_bib_record
 
-    def test_spec_case_4(self):
-        """Test the spec case where the main title and number of part are present,
-        but the name of part is not, and Filemaker indicates that the record is not a series.
-        """
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
-                    Subfield(code="n", value="Number of Part"),
-                ],
-            )
-        )
-        titles = get_title_info(record, is_series=False)
-        expected_result = {
-            "title": "Main Title. Number of Part",
-        }
-        self.assertDictEqual(titles, expected_result)
-
-    def test_spec_case_5(self):
-        """Test the spec case where the main title is present,
-        but the name of part and number of part are not.
-        """
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="245",
-                indicators=Indicators("0", "0"),
-                subfields=[
-                    Subfield(code="a", value="Main Title"),
+    def test_spec_cases(self):
+        """Test each spec case, building the 245 field from its subfields."""
+        # Test cases are tuples of (description, 245 subfields, is_series, expected result).
+        test_cases = [
+            (
+                "Case 1: main title, name of part, and number of part are present",
+                [("a", "Main Title"), ("p", "Name of Part"), ("n", "Number of Part")],
+                None,
+                {
+                    "title": "Main Title. Name of Part. Number of Part",
+                    "series_title": "Main Title",
+                    "episode_title": "Name of Part. Number of Part",
+                },
+            ),
+            # This should be sufficient to cover the other cases as well,
+            # since this case includes all relevant title fields.
+            (
+                "Case 1 with remainder of title",
+                [
+                    ("a", "Main Title"),
+                    ("b", "Remainder of Title"),
+                    ("p", "Name of Part"),
+                    ("n", "Number of Part"),
                 ],
-            )
-        )
-        titles = get_title_info(record)
-        expected_result = {
-            "title": "Main Title",
-        }
-        self.assertDictEqual(titles, expected_result)
+                None,
+                {
+                    "title": "Main Title. Remainder of Title. Name of Part. Number of Part",
+                    "series_title": "Main Title. Remainder of Title",
+                    "episode_title": "Name of Part. Number of Part",
+                },
+            ),
+            (
+                "Case 2: main title and name of part are present, but not number of part",
+                [("a", "Main Title"), ("p", "Name of Part")],
+                None,
+                {
+                    "title": "Main Title. Name of Part",
+                    "series_title": "Main Title",
+                    "episode_title": "Name of Part",
+                },
+            ),
+            (
+                "Case 3: main title and number of part are present, but not name of part, "
+                "and Filemaker indicates that the record is a series",
+                [("a", "Main Title"), ("n", "Number of Part")],
+                True,
+                {
+                    "title": "Main Title. Number of Part",
+                    "series_title": "Main Title",
+                    "episode_title": "Number of Part",
+                },
+            ),
+            (
+                "Case 4: main title and number of part are present, but not name of part, "
+                "and Filemaker indicates that the record is not a series",
+                [("a", "Main Title"), ("n", "Number of Part")],
+                False,
+                {"title": "Main Title. Number of Part"},
+            ),
+            (
+                "Case 5: main title is present, but not name of part or number of part",
+                [("a", "Main Title")],
+                None,
+                {"title": "Main Title"},
+            ),
+        ]
+        for description, subfields, is_series, expected_result in test_cases:
+            with self.subTest(description):
+                record = self._get_record_without_245()
+                record.add_field(
+                    Field(
+                        tag="245",
+                        indicators=_TITLE_INDICATORS,
+                        subfields=[
+                            Subfield(code=code, value=value)
+                            for code, value in subfields
+                        ],
+                    )
+                )
+                if is_series is None:
+                    titles = get_title_info(record)
+                else:
+                    titles = get_title_info(record, is_series=is_series)
+                self.assertDictEqual(titles, expected_result)
 
     def test_error_condition_no_main_title(self):
         """Test the error condition where there is no main title."""
@@ -253,7 +222,7 @@ class TestMarcTitlesRegion(TestCase):
         record.add_field(
             Field(
                 tag="245",
-                indicators=Indicators("0", "0"),
+                indicators=_TITLE_INDICATORS,
             )
         )
         with self.assertRaises(ValueError):
@@ -271,7 +240,7 @@ class TestMarcTitlesRegion(TestCase):
         record.add_field(
             Field(
                 tag="245",
-                indicators=Indicators("0", "0"),
+                indicators=_TITLE_INDICATORS,
                 subfields=[
                     Subfield(code="a", value="Main Title /"),  # Trailing slash
                     Subfield(code="p", value="[Name of Part]"),  # Square brackets
@@ -291,93 +260,71 @@ class TestMarcTitlesRegion(TestCase):
 class TestMarcDatesRegion(TestCase):
     """Test the dates region of the MARC metadata module."""
 
-    def setUp(self):
-        minimal_bib_record = _get_minimal_bib_record()
-        self.minimal_bib_record = minimal_bib_record
+    def test_date_fields(self):
+        """Test date info from records with various date fields added."""
 
-    def test_no_date_field(self):
-        record = self.minimal_bib_record
-        date_info = get_date_info(record)
-        expected_result = {"release_broadcast_date": ""}
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_field_with_indicators(self):
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators("1", "0"),  # Indicators not both blank
-                subfields=[
-                    Subfield(code="c", value="2023"),
-                ],
+        def _date_field(tag: str, indicators: Indicators, date: str) -> Field:
+            return Field(
+                tag=tag,
+                indicators=indicators,
+                subfields=[Subfield(code="c", value=date)],
             )
-        )
-        date_info = get_date_info(record)
-        expected_result = {"release_broadcast_date": ""}
-        self.assertDictEqual(date_info, expected_result)
 
-    def test_date_field_260(self):
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators(" ", " "),  # Both indicators blank
-                subfields=[
-                    Subfield(code="c", value="2023"),
-                ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "2023",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_260_priority_over_264(self):
-        record = self.minimal_bib_record
-        # Add a 264 field, which should be ignored if 260 is present
-        record.add_field(
-            Field(
-                tag="264",
-                indicators=Indicators(" ", "2"),
-                subfields=[
-                    Subfield(code="c", value="2022"),
-                ],
-            )
-        )
-        # Add the 260 field, which should take priority
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators(" ", " "),
-                subfields=[
-                    Subfield(code="c", value="2023"),
-                ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "2023",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_264_first_indicator_not_blank(self):
-        record = self.minimal_bib_record
-        # Add a 264 field with first indicator not blank, which should be ignored
-        record.add_field(
-            Field(
-                tag="264",
-                indicators=Indicators("1", "2"),
-                subfields=[
-                    Subfield(code="c", value="2023"),
+        # Test cases are tuples of (description, fields to add, expected result).
+        test_cases = [
+            ("No date field", [], {"release_broadcast_date": ""}),
+            (
+                "260 indicators not both blank",
+                [_date_field("260", Indicators("1", "0"), "2023")],
+                {"release_broadcast_date": ""},
+            ),
+            (
+                "260 with both indicators blank",
+                [_date_field("260", _BLANK_INDICATORS, "2023")],
+                {"release_broadcast_date": "2023"},
+            ),
+            (
+                # The 264 field should be ignored if 260 is present.
+                "260 has priority over 264",
+                [
+                    _date_field("264", Indicators(" ", "2"), "2022"),
+                    _date_field("260", _BLANK_INDICATORS, "2023"),
                 ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "",
-        }
-        self.assertDictEqual(date_info, expected_result)
+                {"release_broadcast_date": "2023"},
+            ),
+            (
+                "264 with first indicator not blank is ignored",
+                [_date_field("264", Indicators("1", "2"), "2023")],
+                {"release_broadcast_date": ""},
+            ),
+            (
+                "Brackets, period, and non-standard format",
+                [_date_field("260", _BLANK_INDICATORS, "[April 5, 2023].")],
+                {"release_broadcast_date": "[2023-04-05]"},
+            ),
+            (
+                "Simple, four-digit year in brackets",
+                [_date_field("260", _BLANK_INDICATORS, "[2023]")],
+                {"release_broadcast_date": "[2023]"},
+            ),
+            (
+                "Hyphen to indicate an uncertain year",
+                [_date_field("260", _BLANK_INDICATORS, "[202-]")],
+                {"release_broadcast_date": "[202-]"},
+            ),
+            (
+                # 008 must be 40 characters, with a date in position 7-10.
+                "008 date",
+                [Field(tag="008", data="xxxxxxx1970xxxxxxxxxxxxxxxxxxxxxxxxxxxxx")],
+                {"release_broadcast_date": "1970"},
+            ),
+        ]
+        for description, fields, expected_result in test_cases:
+            with self.subTest(description):
+                record = _get_minimal_bib_record()
+                for field in fields:
+                    record.add_field(field)
+                self.assertDictEqual(get_date_info(record), expected_result)
 
     def test_date_264_indicator_priority(self):
         # When multiple 264 $c fields are present,
@@ -415,76 +362,6 @@ class TestMarcDatesRegion(TestCase):
                     )
                 self.assertDictEqual(get_date_info(record), expected)
 
-    def test_date_formatting(self):
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators(" ", " "),
-                subfields=[
-                    Subfield(
-                        code="c", value="[April 5, 2023]."
-                    ),  # Brackets, period, and non-standard format
-                ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "[2023-04-05]",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_formatting_year_in_brackets(self):
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators(" ", " "),
-                subfields=[
-                    Subfield(
-                        code="c", value="[2023]"
-                    ),  # Simple, four-digit year in brackets
-                ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "[2023]",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_formatting_year_in_brackets_with_hyphens(self):
-        record = self.minimal_bib_record
-        record.add_field(
-            Field(
-                tag="260",
-                indicators=Indicators(" ", " "),
-                subfields=[
-                    Subfield(
-                        code="c", value="[202-]"
-                    ),  # Hyphen to indicate an uncertain year
-                ],
-            )
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "[202-]",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
-    def test_date_field_008(self):
-        record = self.minimal_bib_record
-        # Add a 008 field with a date in position 7-10
-        record.add_field(
-            # 008 must be 40 characters
-            Field(tag="008", data="xxxxxxx1970xxxxxxxxxxxxxxxxxxxxxxxxxxxxx")
-        )
-        date_info = get_date_info(record)
-        expected_result = {
-            "release_broadcast_date": "1970",
-        }
-        self.assertDictEqual(date_info, expected_result)
-
     def test_date_only_month_and_year(self):
         """Test that dates with only month and year in various formats are parsed correctly."""
 
@@ -505,7 +382,7 @@ class TestMarcDatesRegion(TestCase):
                 record.add_field(
                     Field(
                         tag="260",
-                        indicators=Indicators(" ", " "),
+                        indicators=_BLANK_INDICATORS,
                         subfields=[Subfield(code="c", value=test_case)],
                     )
                 )
@@ -521,6 +398,28 @@ class TestMarcCreatorsRegion(TestCase):
     If this changes, tests will need to be revised.
     """
 
+    @classmethod
+    def setUpClass(cls):
+        # Needed for personal name parsing in get_creators.
+        # These tests are about which names are kept, not how well NER finds them,
+        # so a blank pipeline which recognizes every name in the test cases is enough,
+        # and loads far faster than a trained model.
+        # TestMarcCreatorsRegionTrainedModel runs the same tests with the real model.
+        cls.nlp_model = spacy.blank("en")
+        ruler = cls.nlp_model.add_pipe("entity_ruler")
+        ruler.add_patterns(
+            [
+                {"label": "PERSON", "pattern": name}
+                for name in (
+                    "John Director",
+                    "Jessica Co-Director",
+                    "Jane Writer",
+                    "Barry Shear",
+                    "John Bradford",
+                )
+            ]
+        )
+
     def setUp(self):
         # Define test cases
         test_cases = [
@@ -558,11 +457,194 @@ class TestMarcCreatorsRegion(TestCase):
                 f245.add_subfield(code="c", value=test_case["input"])
             self.test_records.append((test_record, test_case["expected"]))
 
-        # Needed for personal name parsing in get_creators
-        self.nlp_model = spacy.load("en_core_web_md")
-
     def test_creator_parsing(self):
         for test_record, expected in self.test_records:
             with self.subTest(test_record=test_record):
                 creators = get_creators(test_record, self.nlp_model)
                 self.assertEqual(creators, expected)
+
+    def test_attribution_phrase_matching_ignores_case(self):
+        test_cases = [
+            ("Directed by John Director. ", "Directed by John Director."),
+            ("A FILM BY John Director", "A FILM BY John Director"),
+            ("producer-Director, Barry Shear", "producer-Director, Barry Shear"),
+            ("writer, Jane Writer.", ""),
+        ]
+        for source_string, expected in test_cases:
+            with self.subTest(source_string=source_string):
+                self.assertEqual(_get_creator_string(source_string), expected)
+
+
+@skipUnless(spacy.util.is_package("en_core_web_md"), "en_core_web_md is not installed")
+class TestMarcCreatorsRegionTrainedModel(TestMarcCreatorsRegion):
+    """Run the creators region tests with the trained NER model used in production."""
+
+    @classmethod
+    def setUpClass(cls):
+        # Loading the model is slow, so load it once for all tests in the class;
+        # load_ner_model() caches it, and leaves out components not needed for NER.
+        cls.nlp_model = load_ner_model("en_core_web_md")
+
+
+class TestMarcCreatorsCache(TestCase):
+    """Test that repeated creator strings are only processed by NER once."""
+
+    def setUp(self):
+        # A blank pipeline with a rule-based entity recognizer is enough here,
+        # and much faster to load than a trained model.
+        self.nlp_model = spacy.blank("en")
+        ruler = self.nlp_model.add_pipe("entity_ruler")
+        ruler.add_patterns([{"label": "PERSON", "pattern": "John Director"}])
+        clear_creators_cache()
+
+    def tearDown(self):
+        clear_creators_cache()
+
+    def _get_record_with_creators(self, creators: str) -> Record:
+        record = _get_minimal_bib_record()
+        f245 = record.get("245")
+        if f245:
+            f245.add_subfield(code="c", value=creators)
+        return record
+
+    def test_repeated_creator_strings_are_parsed_once(self):
+        records = [
+            self._get_record_with_creators("director, John Director.") for _ in range(3)
+        ]
+        with patch.object(
+            self.nlp_model, "pipe", wraps=self.nlp_model.pipe
+        ) as mock_pipe:
+            creators = get_creators_batch(records, self.nlp_model)
+            self.assertEqual(creators, [["John Director"]] * 3)
+            # Later calls get the cached result, without running NER.
+            self.assertEqual(
+                get_creators(records[0], self.nlp_model), ["John Director"]
+            )
+        parsed_strings = [list(call.args[0]) for call in mock_pipe.call_args_list]
+        self.assertEqual(parsed_strings, [["director, John Director."], []])
+
+    def test_multiple_processes_give_same_creators(self):
+        # Enough distinct strings for NER to run in 2 processes.
+        records = [
+            self._get_record_with_creators(f"director, John Director. Take {number}.")
+            for number in range(300)
+        ]
+        creators = get_creators_batch(records, self.nlp_model, n_process=2)
+        self.assertEqual(creators, [["John Director"]] * 300)
+
+    def test_batch_size_from_environment(self):
+        records = [self._get_record_with_creators("director, John Director.")]
+        with (
+            patch.dict("os.environ", {"FTVA_ETL_NER_BATCH_SIZE": "8"}),
+            patch.object(
+                self.nlp_model, "pipe", wraps=self.nlp_model.pipe
+            ) as mock_pipe,
+        ):
+            get_creators_batch(records, self.nlp_model)
+        self.assertEqual(mock_pipe.call_args.kwargs["batch_size"], 8)
+
+    def test_invalid_batch_size_from_environment_raises(self):
+        records = [self._get_record_with_creators("director, John Director.")]
+        for value in ("many", "0"):
+            with (
+                self.subTest(value=value),
+                patch.dict("os.environ", {"FTVA_ETL_NER_BATCH_SIZE": value}),
+            ):
+                with self.assertRaisesRegex(ValueError, "FTVA_ETL_NER_BATCH_SIZE"):
+                    get_creators_batch(records, self.nlp_model)
+
+    def test_single_word_creator_strings_are_not_parsed(self):
+        records = [self._get_record_with_creators(" Directors. ")]
+        with patch.object(
+            self.nlp_model, "pipe", wraps=self.nlp_model.pipe
+        ) as mock_pipe:
+            self.assertEqual(get_creators_batch(records, self.nlp_model), [[]])
+        self.assertEqual(list(mock_pipe.call_args.args[0]), [])
+
+    def test_lazy_ner_skips_model_when_names_are_found(self):
+        records = [
+            self._get_record_with_creators("director, John Smith and Jessica Jones."),
+            self._get_record_with_creators("director, John Director."),
+        ]
+        with (
+            patch("src.ftva_etl.metadata.marc.USE_LAZY_NER", True),
+            patch.object(
+                self.nlp_model, "pipe", wraps=self.nlp_model.pipe
+            ) as mock_pipe,
+        ):
+            creators = get_creators_batch(records, self.nlp_model)
+        self.assertEqual(creators, [["John Smith", "Jessica Jones"], ["John Director"]])
+        # Removing "director" leaves only "John" in the second string,
+        # which is not a name, so that string falls back to NER.
+        self.assertEqual(
+            list(mock_pipe.call_args.args[0]), ["director, John Director."]
+        )
+
+    def test_lazy_ner_does_not_return_other_credits(self):
+        test_cases = [
+            # Title-cased attribution phrase mid-string
+            ("Produced by Jane Doe, Directed By John Smith", ()),
+            # Segments without an attribution phrase are ignored
+            ("Directed by John Smith; Produced By Jane Doe", ("John Smith",)),
+            # Other credits in the same segment can't be told apart from names
+            ("Directed By John Smith, Produced By Jane Doe", ()),
+            # Name right after a multi-word credit
+            ("John Smith, Director Of Photography Bob Ray", ()),
+            # Too many words to be sure of the name
+            ("directed by Anna Maria Van Der Berg", ()),
+            ("A Film By John Smith.", ("John Smith",)),
+        ]
+        for creator_string, expected in test_cases:
+            with self.subTest(creator_string=creator_string):
+                self.assertEqual(_find_names(creator_string), expected)
+
+
+class TestMarcFullRecord(TestCase):
+    """Test extracting all metadata from a MARC record at once."""
+
+    def setUp(self):
+        self.record = _get_minimal_bib_record()
+        self.record.add_field(Field(tag="008", data="x" * 35 + "eng" + "xx"))
+        f245 = self.record.get("245")
+        if f245:
+            f245.add_subfield(code="p", value="F245p.")
+        for indicator2, date in [("4", "2001"), ("1", "2000")]:
+            self.record.add_field(
+                Field(
+                    tag="264",
+                    indicators=Indicators(" ", indicator2),
+                    subfields=[Subfield(code="c", value=date)],
+                )
+            )
+
+    def test_get_bib_metadata_matches_individual_getters(self):
+        # Creators are passed in, so no NER model is needed.
+        metadata = get_bib_metadata(self.record, None, creators=["John Director"])
+        expected = {
+            "alma_bib_id": get_record_id(self.record),
+            "language": get_language_name(self.record),
+            "creators": ["John Director"],
+            **get_title_info(self.record),
+            **get_date_info(self.record),
+        }
+        self.assertEqual(metadata, expected)
+        self.assertEqual(metadata["language"], "English")
+        self.assertEqual(metadata["release_broadcast_date"], "2000")
+
+    def test_process_records(self):
+        records = [self.record, _get_minimal_bib_record()]
+        # A blank spacy pipeline has no NER, so no creators are parsed.
+        expected = [
+            get_bib_metadata(record, None, is_series, creators=[])
+            for record, is_series in zip(records, [True, False])
+        ]
+        for max_workers in [1, 2]:
+            with self.subTest(max_workers=max_workers):
+                metadata = process_records(
+                    records,
+                    is_series=[True, False],
+                    model_name="blank:en",
+                    max_workers=max_workers,
+                    chunk_size=1,
+                )
+                self.assertEqual(metadata, expected)
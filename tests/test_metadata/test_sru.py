@@ -1,5 +1,27 @@
 from unittest import TestCase
-from src.ftva_etl.metadata.utils import _is_inventory_number_match
+from pymarc import Field, Record, Subfield
+from src.ftva_etl.metadata.utils import (
+    _is_inventory_number_match,
+    filter_by_inventory_number_and_library,
+    filter_by_inventory_number_and_library_indexed,
+    index_ava,
+)
+
+
+def _get_record_with_holdings(holdings: list[tuple[str, str]]) -> Record:
+    record = Record()
+    for library_code, call_number in holdings:
+        record.add_field(
+            Field(
+                tag="AVA",
+                indicators=[" ", " "],
+                subfields=[
+                    Subfield(code="b", value=library_code),
+                    Subfield(code="d", value=call_number),
+                ],
+            )
+        )
+    return record
 
 
 class TestInventoryNumberMatch(TestCase):
@@ -13,3 +35,46 @@ class TestInventoryNumberMatch(TestCase):
         self.assertTrue(_is_inventory_number_match("DVD123", "DVD123 T"))
         self.assertTrue(_is_inventory_number_match("VA456", "VA456 M"))
         self.assertTrue(_is_inventory_number_match("XFE789", "XFE789 R"))
+
+    def test_suffix_without_known_prefix(self):
+        self.assertFalse(_is_inventory_number_match("ABC123", "ABC123 T"))
+
+    def test_unknown_suffix(self):
+        self.assertFalse(_is_inventory_number_match("DVD123", "DVD123 X"))
+        self.assertFalse(_is_inventory_number_match("DVD123", "DVD1234 T"))
+
+
+class TestFilterByInventoryNumberAndLibrary(TestCase):
+    def setUp(self):
+        self.ftva_record = _get_record_with_holdings(
+            [("FTVA", "DVD123 T"), ("ftva", "DVD123")]
+        )
+        self.other_library_record = _get_record_with_holdings([("other", "DVD123")])
+        self.other_number_record = _get_record_with_holdings([("ftva", "DVD456")])
+        self.records = [
+            self.ftva_record,
+            self.other_library_record,
+            self.other_number_record,
+        ]
+
+    def test_filter_by_inventory_number_and_library(self):
+        self.assertEqual(
+            filter_by_inventory_number_and_library(self.records, "DVD123"),
+            [self.ftva_record],
+        )
+
+    def test_indexed_filter_matches_each_inventory_number(self):
+        ava_index = index_ava(self.records)
+        # Only holdings from the FTVA library are indexed.
+        self.assertEqual(len(ava_index), 3)
+        self.assertEqual(
+            filter_by_inventory_number_and_library_indexed(ava_index, "DVD123"),
+            [self.ftva_record],
+        )
+        self.assertEqual(
+            filter_by_inventory_number_and_library_indexed(ava_index, "DVD456"),
+            [self.other_number_record],
+        )
+        self.assertEqual(
+            filter_by_inventory_number_and_library_indexed(ava_index, "DVD789"), []
+        )
@@ -1,7 +1,12 @@
 from io import StringIO
 import logging
 from unittest import TestCase
-from src.ftva_etl.metadata.utils import configure_logging
+from unittest.mock import patch
+from src.ftva_etl.metadata.utils import (
+    cleanup_production_type,
+    configure_logging,
+    parse_date,
+)
 
 
 class TestLogging(TestCase):
@@ -70,3 +75,31 @@ class TestLogging(TestCase):
         # ...but not DEBUG messages, which are below level set on parent
         logger.debug("This debug message should not appear")
         self.assertNotIn("This debug message should not appear", log_output.getvalue())
+
+
+class TestParseDate(TestCase):
+    """Tests related to parsing dates."""
+
+    def test_common_precise_dates_do_not_use_dateutil(self):
+        """Test that common full dates are parsed without the general dateutil parser."""
+        with patch("dateutil.parser.parse") as mock_parse:
+            self.assertEqual(parse_date("1996-10-05"), "1996-10-05")
+            self.assertEqual(parse_date("October 5, 1996."), "1996-10-05")
+            self.assertEqual(parse_date("[Oct. 5, 1996]"), "[1996-10-05]")
+        mock_parse.assert_not_called()
+
+    def test_other_dates_fall_back_to_dateutil(self):
+        """Test that other dates are still parsed or kept as-is."""
+        self.assertEqual(parse_date("Sept. 5, 1996"), "1996-09-05")
+        self.assertEqual(parse_date("5 October 1996"), "1996-10-05")
+        self.assertEqual(parse_date("[October 1996]"), "[October 1996]")
+        self.assertEqual(parse_date("19--."), "19--")
+
+
+class TestCleanupProductionType(TestCase):
+    """Tests related to cleaning up Filemaker production types."""
+
+    def test_cleanup_production_type(self):
+        """Test that items are stripped and lowercased, and empty items are dropped."""
+        self.assertEqual(cleanup_production_type(" NEWS \rSHORT\r"), ["news", "short"])
+        self.assertEqual(cleanup_production_type(""), [])